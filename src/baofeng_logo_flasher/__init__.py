@@ -4,13 +4,30 @@ Baofeng Logo Flasher - Standalone logo modification utility for UV-5RM radios
 Complete safe image inspection, modification, and upload workflow.
 """
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "Codex"
 
-from baofeng_logo_flasher.protocol import UV5RMTransport, UV5RMProtocol
+if TYPE_CHECKING:
+    from baofeng_logo_flasher.protocol import UV5RMTransport, UV5RMProtocol
 
 __all__ = [
     "UV5RMTransport",
     "UV5RMProtocol",
     "__version__",
 ]
+
+# The protocol package pulls in pyserial; resolve these re-exports on first
+# access so `import baofeng_logo_flasher.cli` (and --help) does not pay for it.
+_LAZY_EXPORTS = {"UV5RMTransport", "UV5RMProtocol"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        from baofeng_logo_flasher import protocol
+
+        value = getattr(protocol, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -20,6 +20,12 @@ class BmpInfo:
     top_down: bool
 
 
+# BITMAPFILEHEADER plus the leading BITMAPINFOHEADER fields used below:
+# signature, file size, 2 reserved, pixel offset, header size, width, height,
+# planes, bits per pixel, compression, image size.
+_BMP_HEADER = struct.Struct("<2sIHHIIiiHHII")
+
+
 def _row_size_bytes(width: int, bits_per_pixel: int) -> int:
     return ((bits_per_pixel * width + 31) // 32) * 4
 
@@ -28,23 +34,27 @@ def parse_bmp_header(data: bytes, allow_partial: bool = False) -> BmpInfo:
     if len(data) < 54:
         raise ValueError("BMP too small to contain header")
 
-    if data[0:2] != b"BM":
+    (
+        signature,
+        file_size,
+        _reserved1,
+        _reserved2,
+        data_offset,
+        header_size,
+        width,
+        height,
+        planes,
+        bits_per_pixel,
+        compression,
+        image_size,
+    ) = _BMP_HEADER.unpack_from(data)
+
+    if signature != b"BM":
         raise ValueError("Missing BMP signature")
 
-    file_size = struct.unpack_from("<I", data, 2)[0]
-    data_offset = struct.unpack_from("<I", data, 10)[0]
-    header_size = struct.unpack_from("<I", data, 14)[0]
-
     if header_size < 40:
         raise ValueError("Unsupported BMP header size")
 
-    width = struct.unpack_from("<i", data, 18)[0]
-    height = struct.unpack_from("<i", data, 22)[0]
-    planes = struct.unpack_from("<H", data, 26)[0]
-    bits_per_pixel = struct.unpack_from("<H", data, 28)[0]
-    compression = struct.unpack_from("<I", data, 30)[0]
-    image_size = struct.unpack_from("<I", data, 34)[0]
-
     if planes != 1:
         raise ValueError("Invalid BMP planes value")
 
@@ -1,6 +1,7 @@
 """A5 boot logo flashing support for Baofeng UV-5RM / UV-17 family."""
 
-from typing import Dict, List, Optional, Callable
+from typing import BinaryIO, Dict, List, Optional, Callable, Tuple, Union
+import functools
 import logging
 
 try:
@@ -76,11 +77,28 @@ def _build_serial_flash_configs() -> Dict[str, Dict]:
 SERIAL_FLASH_CONFIGS: Dict[str, Dict] = _build_serial_flash_configs()
 
 
-def list_serial_ports() -> List[str]:
-    """List available serial ports."""
+@functools.lru_cache(maxsize=1)
+def _comports() -> Tuple:
+    return tuple(serial.tools.list_ports.comports())
+
+
+def list_serial_port_info(refresh: bool = False) -> Tuple:
+    """
+    Return pyserial ListPortInfo entries for the visible serial ports.
+
+    Enumeration walks sysfs (or WMI on Windows), so the snapshot is cached
+    for the process; pass refresh=True to rescan for hot-plugged adapters.
+    """
     if not serial:
-        return []
-    return [p.device for p in serial.tools.list_ports.comports()]
+        return ()
+    if refresh:
+        _comports.cache_clear()
+    return _comports()
+
+
+def list_serial_ports(refresh: bool = False) -> List[str]:
+    """List available serial ports (see list_serial_port_info for caching)."""
+    return [p.device for p in list_serial_port_info(refresh=refresh)]
 
 
 def read_radio_id(
@@ -182,7 +200,7 @@ def _do_ident_uv17pro(
 
 def flash_logo(
     port: str,
-    bmp_path: str,
+    bmp_path: Union[str, BinaryIO],
     config: Dict,
     simulate: bool = False,
     progress_cb: Optional[Callable[[int, int], None]] = None,
@@ -218,7 +236,7 @@ def flash_logo(
 
 def _flash_logo_a5_protocol(
     port: str,
-    bmp_path: str,
+    bmp_path: Union[str, BinaryIO],
     config: Dict,
     simulate: bool = False,
     progress_cb: Optional[Callable[[int, int], None]] = None,
@@ -229,7 +247,7 @@ def _flash_logo_a5_protocol(
     """
     Flash logo using the A5 framing protocol for UV-5RM/UV-17 family.
     """
-    from .protocol.logo_protocol import upload_logo as protocol_upload_logo
+    from .protocol.logo_protocol import BAUD_RATE, upload_logo as protocol_upload_logo
 
     if simulate:
         from PIL import Image
@@ -257,4 +275,6 @@ def _flash_logo_a5_protocol(
         debug_output_dir=debug_output_dir,
         address_mode=write_address_mode,
         pixel_order=pixel_order,
+        baudrate=int(config.get("baudrate", BAUD_RATE)),
+        low_latency=bool(config.get("low_latency", True)),
     )
@@ -4,101 +4,311 @@ Baofeng Logo Flasher CLI
 Complete command-line interface for safe logo flashing with safety verification.
 """
 
+import contextlib
+import functools
+import os
+import stat
 import sys
+import time
 import logging
 import json
-from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Dict, Optional, Tuple
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
-from rich.logging import RichHandler
-from rich.progress import Progress, BarColumn, TextColumn
+from rich.text import Text
 
-from baofeng_logo_flasher.protocol import UV5RMTransport, UV5RMProtocol
-from baofeng_logo_flasher.boot_logo import (
-    SERIAL_FLASH_CONFIGS,
-)
+try:
+    import orjson
+except ImportError:  # optional: pip install baofeng-logo-flasher[json]
+    orjson = None
 
-# Import from core module for unified logic
-from baofeng_logo_flasher.core.parsing import (
-    parse_offset as _parse_offset_core,
-    parse_bitmap_format as _parse_bitmap_format_core,
-)
+# Protocol, boot_logo and core.parsing pull in pyserial and PIL; they are
+# imported inside the commands that use them to keep --help and listing
+# commands fast.
 from baofeng_logo_flasher.core.safety import (
     SafetyContext,
     require_write_permission,
     WritePermissionError,
+    WriteDenyReason,
     CONFIRMATION_TOKEN,
     create_cli_safety_context,
 )
-from baofeng_logo_flasher.core.actions import (
-    flash_logo_serial as core_flash_logo_serial,
-)
 from baofeng_logo_flasher.core.messages import (
     WarningItem,
     MessageLevel,
 )
 from baofeng_logo_flasher.models import (
     get_model as registry_get_model,
-    detect_model as registry_detect_model,
     get_capabilities as registry_get_capabilities,
+    Capability,
     SafetyLevel,
 )
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True)],
-)
+
+def _configure_logging(plain: bool = False, level: int = logging.INFO) -> None:
+    """
+    Install the root log handler.
+
+    Rich rendering is only worth its cost on an interactive terminal. When
+    stderr is redirected, or a command emits machine-readable output, log
+    records go through a plain StreamHandler on stderr so stdout stays clean.
+    """
+    if plain or not sys.stderr.isatty():
+        handler: logging.Handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    else:
+        from rich.logging import RichHandler
+
+        handler = RichHandler(rich_tracebacks=True)
+    logging.basicConfig(level=level, format="%(message)s", handlers=[handler], force=True)
+
+
 logger = logging.getLogger("baofeng_logo_flasher")
 
-# Setup Rich console
-console = Console()
+# Setup Rich console. Rich already drops colour when stdout is not a
+# terminal; skip the repr highlighter's regex pass there too, since its only
+# output is colour. Markup stays on: it is still needed to strip tags.
+console = Console(highlight=sys.stdout.isatty())
 
 app = typer.Typer(help="🔧 Baofeng UV-5RM Logo Flasher - Safe image modification")
 
 
+@app.callback()
+def _init(
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
+    no_rich: bool = typer.Option(
+        False,
+        "--no-rich",
+        help="Plain log lines on stderr even on a terminal",
+    ),
+) -> None:
+    """Configure logging once per invocation, before the subcommand runs."""
+    _configure_logging(plain=no_rich, level=logging.DEBUG if verbose else logging.INFO)
+
+
+@functools.lru_cache(maxsize=None)
+def _serial_flash_configs() -> Dict[str, Dict]:
+    """Return the A5 serial flash configs, importing boot_logo on first use."""
+    from baofeng_logo_flasher.boot_logo import SERIAL_FLASH_CONFIGS
+
+    return SERIAL_FLASH_CONFIGS
+
+
+@functools.lru_cache(maxsize=None)
+def _sorted_models() -> Tuple[str, ...]:
+    """Model names for help/error listings (configs are fixed at import)."""
+    return tuple(sorted(_serial_flash_configs()))
+
+
+@functools.lru_cache(maxsize=None)
+def _models_by_casefold() -> Dict[str, str]:
+    """Map case-folded model names to their SERIAL_FLASH_CONFIGS keys."""
+    return {name.casefold(): name for name in _serial_flash_configs()}
+
+
+def _resolve_model(name: str) -> Optional[str]:
+    """Return the canonical model name for ``name``, ignoring case."""
+    return _models_by_casefold().get(name.casefold())
+
+
+@functools.lru_cache(maxsize=None)
+def _model_list_rows() -> Tuple[Tuple[str, ...], ...]:
+    """Formatted list-models table rows, one per model in name order."""
+    configs = _serial_flash_configs()
+    rows = []
+    for name in _sorted_models():
+        cfg = configs[name]
+        rows.append((
+            name,
+            f"{cfg['size'][0]}x{cfg['size'][1]}",
+            cfg.get("color_mode", "N/A"),
+            _fmt_hex4(cfg.get("start_addr", 0)),
+            "Yes" if cfg.get("encrypt", False) else "No",
+            cfg.get("protocol", "a5_logo"),
+            str(cfg.get("write_addr_mode", "-")),
+        ))
+    return tuple(rows)
+
+
+@functools.lru_cache(maxsize=None)
+def _model_config_rows(model: str) -> Tuple[Tuple[str, str], ...]:
+    """Formatted (property, value) rows for show-model-config."""
+    cfg = _serial_flash_configs()[model]
+    rows = [
+        ("Logo Size", f"{cfg['size'][0]}x{cfg['size'][1]} pixels"),
+        ("Color Mode", cfg.get("color_mode", "N/A")),
+        ("Start Address", _fmt_hex4(cfg.get("start_addr", 0))),
+        ("Block Size", str(cfg.get("block_size", 64))),
+        ("Encryption", "Yes" if cfg.get("encrypt", False) else "No"),
+        ("Protocol", str(cfg.get("protocol", "a5_logo"))),
+    ]
+    if "write_addr_mode" in cfg:
+        rows.append(("Write Addr Mode", str(cfg.get("write_addr_mode"))))
+    rows.append(("Baud Rate", str(cfg.get("baudrate", 9600))))
+    rows.append(("Timeout", f"{cfg.get('timeout', 3.0)}s"))
+
+    # Optional protocol magic display
+    magic = cfg.get("magic", b"")
+    if magic:
+        if len(magic) == 16:
+            try:
+                rows.append(("Magic String", magic.decode("ascii")))
+            except UnicodeDecodeError:
+                rows.append(("Magic Bytes", magic.hex().upper()))
+        else:
+            rows.append(("Magic Bytes", magic.hex().upper()))
+
+    if cfg.get("encrypt"):
+        key = cfg.get("key", b"")
+        rows.append(("Encryption Key", key.hex().upper()))
+    return tuple(rows)
+
+
+# Status icons. Pipes, CI logs and legacy code pages (e.g. Windows cp1252)
+# either mangle or fail to encode emoji, so fall back to ASCII tags there.
+_EMOJI_OK = bool(
+    sys.stdout.encoding
+    and sys.stdout.encoding.lower().startswith("utf")
+    and sys.stdout.isatty()
+)
+_OK = "✓" if _EMOJI_OK else "[OK]"
+_WARN = "⚠️" if _EMOJI_OK else "[WARN]"
+_ERR = "❌" if _EMOJI_OK else "[ERR]"
+_INFO = "ℹ️" if _EMOJI_OK else "[INFO]"
+
+# Style/icon lookup tables (built once, shared by all render paths)
+_WARNING_STYLES = {
+    MessageLevel.ERROR: ("red", _ERR),
+    MessageLevel.WARN: ("yellow", _WARN),
+    MessageLevel.INFO: ("blue", _INFO),
+}
+
+_SAFETY_STYLES = {
+    SafetyLevel.SAFE: "[green]Safe[/green]",
+    SafetyLevel.MODERATE: "[yellow]Moderate[/yellow]",
+    SafetyLevel.RISKY: "[red]Risky[/red]",
+}
+
+# Indexed by bool(supported)
+_SUPPORTED_MARKUP = ("[red]No[/red]", "[green]Yes[/green]")
+
+_CAPABILITY_LABELS = {cap: cap.name.replace("_", " ").title() for cap in Capability}
+
+
+# --write-addr-mode choices mapped to the core write_address_mode argument
+# (None lets the model config decide)
+_WRITE_ADDR_MODES: Dict[str, Optional[str]] = {"auto": None, "byte": "byte", "chunk": "chunk"}
+
+
+# Column layouts (header, style) for the report tables
+_PORT_COLUMNS = (("Port", "cyan"), ("Device", "magenta"), ("Description", "green"))
+_MODEL_COLUMNS = (
+    ("Model", "cyan"),
+    ("Logo Size", "green"),
+    ("Color Mode", "magenta"),
+    ("Start Addr", "yellow"),
+    ("Encrypted", "red"),
+    ("Protocol", "blue"),
+    ("Write Addr", "white"),
+)
+_PROPERTY_COLUMNS = (("Property", "cyan"), ("Value", "green"))
+_CAPABILITY_COLUMNS = (
+    ("Operation", "cyan"),
+    ("Supported", "green"),
+    ("Safety", "yellow"),
+    ("Reason", "dim"),
+)
+_REGION_COLUMNS = (
+    ("Address", "cyan"),
+    ("Dimensions", "green"),
+    ("Color Mode", "magenta"),
+    ("Encrypted", "red"),
+)
+
+
+def _make_table(title: str, columns: Tuple[Tuple[str, str], ...]) -> Table:
+    """Create a titled Table with the given (header, style) columns."""
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+def _fmt_hex4(value: int) -> str:
+    """Format an address as 0xNNNN."""
+    return f"0x{value:04X}"
+
+
+def _fmt_range(start: int, end: int) -> str:
+    """Format an address span as 0xNNNN-0xNNNN."""
+    return f"0x{start:04X}-0x{end:04X}"
+
+
 def print_header(text: str) -> None:
     """Print fancy header."""
     console.print(Panel(text, expand=False, style="bold blue"))
 
 
+# Status messages often carry paths, ports and exception text. Printing them
+# verbatim (no markup or highlighting) is faster and keeps '[...]' in user
+# data from being read as Rich tags.
 def print_success(text: str) -> None:
     """Print success message."""
-    console.print(f"✓ {text}", style="green")
+    console.print(f"{_OK} {text}", style="green", markup=False, highlight=False)
 
 
 def print_warning(text: str) -> None:
     """Print warning message."""
-    console.print(f"⚠️  {text}", style="yellow")
+    console.print(f"{_WARN}  {text}", style="yellow", markup=False, highlight=False)
 
 
 def print_error(text: str) -> None:
     """Print error message."""
-    console.print(f"❌ {text}", style="red")
+    console.print(f"{_ERR} {text}", style="red", markup=False, highlight=False)
 
 
 def print_structured_warning(warning: WarningItem, verbose: bool = False) -> None:
     """Print a structured warning with optional remediation."""
-    if warning.level == MessageLevel.ERROR:
-        style = "red"
-        icon = "❌"
-    elif warning.level == MessageLevel.WARN:
-        style = "yellow"
-        icon = "⚠️"
-    else:
-        style = "blue"
-        icon = "ℹ️"
+    style, icon = _WARNING_STYLES.get(warning.level, _WARNING_STYLES[MessageLevel.INFO])
 
-    console.print(f"{icon} [{warning.code.value}] {warning.title}", style=style)
+    lines = [Text(f"{icon} [{warning.code.value}] {warning.title}", style=style)]
     if verbose and warning.detail:
-        console.print(f"   {warning.detail}", style="dim")
+        lines.append(Text(f"   {warning.detail}", style="dim"))
     if verbose and warning.remediation:
-        console.print(f"   → {warning.remediation}", style="cyan")
+        lines.append(Text(f"   → {warning.remediation}", style="cyan"))
+    console.print(Group(*lines))
+
+
+def print_json(payload: object) -> None:
+    """Write a JSON document straight to stdout, bypassing Rich rendering."""
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            sys.stdout.flush()
+            buffer.write(data)
+            buffer.flush()
+        else:
+            sys.stdout.write(data.decode("utf-8"))
+            sys.stdout.flush()
+        return
+    sys.stdout.write(json.dumps(payload, indent=2))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def _jsonable(value: object) -> object:
+    """Convert a model config value to JSON types (bytes become upper-case hex)."""
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex().upper()
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
 
 
 def parse_int(value: Optional[str], label: str) -> Optional[int]:
@@ -106,15 +316,17 @@ def parse_int(value: Optional[str], label: str) -> Optional[int]:
     if value is None:
         return None
     try:
-        if value.startswith("0x") or value.startswith("0X"):
-            return int(value, 16)
-        return int(value)
+        # Not int(value, 0): that would reject decimal input with leading
+        # zeros ("010") and start accepting 0b/0o literals.
+        return int(value, 16 if value[:2] in ("0x", "0X") else 10)
     except ValueError:
         raise typer.BadParameter(f"Invalid {label}: {value}")
 
 
 def parse_offset(value: Optional[str]) -> Optional[int]:
     """CLI-compatible wrapper around core offset parsing."""
+    from baofeng_logo_flasher.core.parsing import parse_offset as _parse_offset_core
+
     try:
         return _parse_offset_core(value)
     except ValueError as exc:
@@ -123,12 +335,48 @@ def parse_offset(value: Optional[str]) -> Optional[int]:
 
 def parse_bitmap_format(value: str):
     """CLI-compatible wrapper around core bitmap-format parsing."""
+    from baofeng_logo_flasher.core.parsing import (
+        parse_bitmap_format as _parse_bitmap_format_core,
+    )
+
     try:
         return _parse_bitmap_format_core(value)
     except ValueError as exc:
         raise typer.BadParameter(str(exc))
 
 
+def _open_input_file(path: str) -> BinaryIO:
+    """
+    Open an input file for reading, exiting with an error if it is unusable.
+
+    The open itself is the existence check and fstat on the handle answers
+    type and size, so later stages read exactly the file validated here
+    instead of re-checking a path that may have changed in between.
+    """
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        print_error(f"File not found: {path}")
+        sys.exit(1)
+    except IsADirectoryError:
+        print_error(f"Not a regular file: {path}")
+        sys.exit(1)
+    except OSError as exc:
+        print_error(f"Cannot read {path}: {exc.strerror or exc}")
+        sys.exit(1)
+
+    st = os.fstat(handle.fileno())
+    if not stat.S_ISREG(st.st_mode):
+        handle.close()
+        print_error(f"Not a regular file: {path}")
+        sys.exit(1)
+    if st.st_size == 0:
+        handle.close()
+        print_error(f"File is empty: {path}")
+        sys.exit(1)
+    return handle
+
+
 def confirm_write_with_details(
     write_flag: bool,
     model: str,
@@ -136,12 +384,12 @@ def confirm_write_with_details(
     bytes_length: int,
     offset: Optional[int] = None,
     confirm_token: Optional[str] = None,
-) -> None:
+) -> SafetyContext:
     """
     Require explicit --write flag AND typed confirmation before any radio write.
 
     This is the CLI-specific wrapper around core.safety.require_write_permission.
-    Uses Rich for display and typer.prompt for input.
+    Uses Rich for display and plain input() for the typed token.
 
     Supports three modes:
     1. Non-interactive (script): --confirm WRITE provided, no prompts
@@ -156,6 +404,10 @@ def confirm_write_with_details(
         offset: Optional offset being written to
         confirm_token: If provided, used for non-interactive confirmation
 
+    Returns:
+        The confirmed SafetyContext, to pass on to core actions. It re-passes
+        require_write_permission there without prompting a second time.
+
     Raises:
         typer.Abort: If confirmation fails or write not permitted
     """
@@ -180,9 +432,9 @@ def confirm_write_with_details(
                 offset=offset,
             )
             print_success("Non-interactive confirmation accepted. Proceeding with write...")
-            return
+            return ctx
         except WritePermissionError as e:
-            if "token mismatch" in str(e).lower():
+            if e.code is WriteDenyReason.TOKEN_MISMATCH:
                 print_error(f"Confirmation token mismatch. Expected: --confirm WRITE")
             else:
                 print_error(str(e))
@@ -190,38 +442,45 @@ def confirm_write_with_details(
 
     # No token provided - need interactive confirmation
     if not is_tty:
-        # Non-interactive environment without token - error with remediation
-        console.print()
-        print_error("Non-interactive environment detected but no confirmation token provided.")
-        console.print()
-        console.print("[bold]For scripted/non-interactive use, provide:[/bold]")
-        console.print(f"  --write --confirm WRITE")
-        console.print()
-        console.print("[bold]Example:[/bold]")
-        console.print(
-            "  baofeng-logo-flasher upload-logo-serial "
-            "--port /dev/ttyUSB0 --in logo.bmp --model UV-5RM --write --confirm WRITE"
-        )
-        console.print()
-        console.print("[dim]The confirmation token 'WRITE' must match exactly (case-insensitive).[/dim]")
+        # Non-interactive environment without token - error with remediation,
+        # buffered so it reaches the terminal in one write.
+        with console:
+            console.print()
+            print_error("Non-interactive environment detected but no confirmation token provided.")
+            console.print()
+            console.print("[bold]For scripted/non-interactive use, provide:[/bold]")
+            console.print(f"  --write --confirm WRITE")
+            console.print()
+            console.print("[bold]Example:[/bold]")
+            console.print(
+                "  baofeng-logo-flasher upload-logo-serial "
+                "--port /dev/ttyUSB0 --in logo.bmp --model UV-5RM --write --confirm WRITE"
+            )
+            console.print()
+            console.print("[dim]The confirmation token 'WRITE' must match exactly (case-insensitive).[/dim]")
         raise typer.Abort()
 
     # Interactive mode - use prompt-based confirmation
     def show_details(details: dict) -> None:
+        lines = [
+            "[bold yellow]⚠️  WRITE CONFIRMATION REQUIRED[/bold yellow]",
+            "",
+            f"Model:         {details.get('model', 'Unknown')}",
+            f"Target:        {details.get('target_region', 'Unknown')}",
+            f"Bytes:         {details.get('bytes_length', 0):,}",
+        ]
+        if details.get("offset"):
+            lines.append(f"Offset:        {details['offset']}")
+        lines.append("")
+        lines.append(f"[bold]Type '{CONFIRMATION_TOKEN}' to proceed, or anything else to abort:[/bold]")
         console.print()
-        console.print(Panel(
-            f"[bold yellow]⚠️  WRITE CONFIRMATION REQUIRED[/bold yellow]\n\n"
-            f"Model:         {details.get('model', 'Unknown')}\n"
-            f"Target:        {details.get('target_region', 'Unknown')}\n"
-            f"Bytes:         {details.get('bytes_length', 0):,}\n"
-            + (f"Offset:        {details.get('offset', '')}\n" if details.get('offset') else "") +
-            f"\n[bold]Type '{CONFIRMATION_TOKEN}' to proceed, or anything else to abort:[/bold]",
-            title="Radio Write Operation",
-            expand=False,
-        ))
+        console.print(Panel("\n".join(lines), title="Radio Write Operation", expand=False))
 
     def prompt_confirmation(prompt_text: str) -> str:
-        return typer.prompt("Confirm")
+        try:
+            return input("Confirm: ")
+        except EOFError:
+            raise typer.Abort()
 
     ctx = SafetyContext(
         write_enabled=write_flag,
@@ -242,19 +501,25 @@ def confirm_write_with_details(
             offset=offset,
         )
         print_success("Confirmation accepted. Proceeding with write...")
+        # The user typed the token; record it so the core action's own gate
+        # accepts this context instead of prompting again.
+        ctx.confirmation_token = CONFIRMATION_TOKEN
+        ctx.interactive = False
+        return ctx
     except WritePermissionError as e:
-        if "requires explicit permission" in str(e):
-            console.print()
-            print_error("Write operation requires --write flag.")
-            console.print("This is a safety measure to prevent accidental writes to your radio.")
-            console.print(f"Review the details below and re-run with --write if you wish to proceed.")
-            console.print()
-            console.print(f"  Model:         {model}")
-            console.print(f"  Target:        {target_region}")
-            console.print(f"  Bytes:         {bytes_length:,}")
-            if offset is not None:
-                console.print(f"  Offset:        0x{offset:06X}")
-        elif "unknown model" in str(e).lower():
+        if e.code is WriteDenyReason.NEEDS_WRITE_FLAG:
+            with console:
+                console.print()
+                print_error("Write operation requires --write flag.")
+                console.print("This is a safety measure to prevent accidental writes to your radio.")
+                console.print(f"Review the details below and re-run with --write if you wish to proceed.")
+                console.print()
+                console.print(f"  Model:         {model}")
+                console.print(f"  Target:        {target_region}")
+                console.print(f"  Bytes:         {bytes_length:,}")
+                if offset is not None:
+                    console.print(f"  Offset:        0x{offset:06X}")
+        elif e.code is WriteDenyReason.UNKNOWN_MODEL:
             print_error("Cannot write to radio with unknown model. Aborting for safety.")
         else:
             print_warning(str(e))
@@ -275,10 +540,7 @@ def ports() -> None:
             print_warning("No serial ports found")
             return
 
-        table = Table(title="Serial Ports")
-        table.add_column("Port", style="cyan")
-        table.add_column("Device", style="magenta")
-        table.add_column("Description", style="green")
+        table = _make_table("Serial Ports", _PORT_COLUMNS)
 
         for port in ports_list:
             table.add_row(port.device, port.name or "-", port.description or "-")
@@ -295,94 +557,82 @@ def list_devices() -> None:
 
 
 @app.command("list-models")
-def list_models() -> None:
+def list_models(
+    output_json: bool = typer.Option(False, "--json", "-j", help="Output as JSON for scripting"),
+) -> None:
     """List supported radio models and their configurations."""
-    print_header("Supported Radio Models")
-
     # A5 serial flash configs (UV-5RM/UV-17 family).
-    if SERIAL_FLASH_CONFIGS:
-        table = Table(title="Serial Flash Models")
-        table.add_column("Model", style="cyan")
-        table.add_column("Logo Size", style="green")
-        table.add_column("Color Mode", style="magenta")
-        table.add_column("Start Addr", style="yellow")
-        table.add_column("Encrypted", style="red")
-        table.add_column("Protocol", style="blue")
-        table.add_column("Write Addr", style="white")
-
-        for name, cfg in sorted(SERIAL_FLASH_CONFIGS.items()):
-            size = f"{cfg['size'][0]}x{cfg['size'][1]}"
-            color = cfg.get("color_mode", "N/A")
-            addr = f"0x{cfg.get('start_addr', 0):04X}"
-            encrypted = "Yes" if cfg.get("encrypt", False) else "No"
-            protocol = cfg.get("protocol", "a5_logo")
-            write_addr = cfg.get("write_addr_mode", "-")
-
-            table.add_row(name, size, color, addr, encrypted, protocol, str(write_addr))
+    serial_flash_configs = _serial_flash_configs()
 
-        console.print(table)
+    if output_json:
+        print_json({
+            "models": [
+                {"name": name, **_jsonable(serial_flash_configs[name])}
+                for name in _sorted_models()
+            ]
+        })
+        return
+
+    # Buffer the whole report and emit it in one write.
+    with console:
+        print_header("Supported Radio Models")
+
+        if serial_flash_configs:
+            table = _make_table("Serial Flash Models", _MODEL_COLUMNS)
 
-    console.print()
-    console.print("Use [cyan]show-model-config <model>[/cyan] for detailed configuration.")
+            for row in _model_list_rows():
+                table.add_row(*row)
+
+            console.print(table)
+
+        console.print()
+        console.print("Use [cyan]show-model-config <model>[/cyan] for detailed configuration.")
 
 
 @app.command("show-model-config")
 def show_model_config(
     model: str = typer.Argument(..., help="Model name (e.g., UV-5RM)"),
+    output_json: bool = typer.Option(False, "--json", "-j", help="Output as JSON for scripting"),
 ) -> None:
     """Show detailed configuration for a specific model."""
-    print_header(f"Model Configuration: {model}")
-
-    # Check serial flash configs first
-    if model in SERIAL_FLASH_CONFIGS:
-        cfg = SERIAL_FLASH_CONFIGS[model]
-
-        table = Table(title=f"{model} Serial Flash Config")
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="green")
-
-        table.add_row("Logo Size", f"{cfg['size'][0]}x{cfg['size'][1]} pixels")
-        table.add_row("Color Mode", cfg.get("color_mode", "N/A"))
-        table.add_row("Start Address", f"0x{cfg.get('start_addr', 0):04X}")
-        table.add_row("Block Size", str(cfg.get("block_size", 64)))
-        table.add_row("Encryption", "Yes" if cfg.get("encrypt", False) else "No")
-        table.add_row("Protocol", str(cfg.get("protocol", "a5_logo")))
-        if "write_addr_mode" in cfg:
-            table.add_row("Write Addr Mode", str(cfg.get("write_addr_mode")))
-        table.add_row("Baud Rate", str(cfg.get("baudrate", 9600)))
-        table.add_row("Timeout", f"{cfg.get('timeout', 3.0)}s")
-
-        # Optional protocol magic display
-        magic = cfg.get("magic", b"")
-        if magic:
-            if len(magic) == 16:
-                try:
-                    table.add_row("Magic String", magic.decode("ascii"))
-                except UnicodeDecodeError:
-                    table.add_row("Magic Bytes", magic.hex().upper())
-            else:
-                table.add_row("Magic Bytes", magic.hex().upper())
+    serial_flash_configs = _serial_flash_configs()
+    model = _resolve_model(model) or model
 
-        if cfg.get("encrypt"):
-            key = cfg.get("key", b"")
-            table.add_row("Encryption Key", key.hex().upper())
+    if output_json:
+        if model not in serial_flash_configs:
+            print_json({"error": f"Model '{model}' not found", "available": list(_sorted_models())})
+            sys.exit(1)
+        print_json({"model": model, "config": _jsonable(serial_flash_configs[model])})
+        return
 
-        console.print(table)
+    # Buffer the whole report and emit it in one write.
+    with console:
+        print_header(f"Model Configuration: {model}")
 
-        if cfg.get("post_ident_magics"):
-            console.print()
-            print_warning("This model uses additional post-ident magic sequences.")
+        # Check serial flash configs first
+        if model in serial_flash_configs:
+            cfg = serial_flash_configs[model]
 
-        return
+            table = _make_table(f"{model} Serial Flash Config", _PROPERTY_COLUMNS)
+
+            for row in _model_config_rows(model):
+                table.add_row(*row)
+
+            console.print(table)
+
+            if cfg.get("post_ident_magics"):
+                console.print()
+                print_warning("This model uses additional post-ident magic sequences.")
 
-    # Model not found
-    print_error(f"Model '{model}' not found.")
-    console.print()
-    console.print("Available models:")
-    all_models = sorted(SERIAL_FLASH_CONFIGS.keys())
-    for m in all_models:
-        console.print(f"  - {m}")
-    sys.exit(1)
+            return
+
+        # Model not found
+        print_error(f"Model '{model}' not found.")
+        console.print()
+        console.print("Available models:")
+        for m in _sorted_models():
+            console.print(f"  - {m}")
+        sys.exit(1)
 
 
 @app.command()
@@ -398,8 +648,9 @@ def capabilities(
     Connect a radio via --port for live detection.
     """
     detected_model_name = model
-    version_bytes = None
-    ident_bytes = None
+
+    if output_json:
+        _configure_logging(plain=True, level=logging.getLogger().level)
 
     # If port provided, detect model from connected radio
     if port:
@@ -408,15 +659,15 @@ def capabilities(
             console.print(f"Port: {port}")
 
         try:
-            transport = UV5RMTransport(port)
-            transport.open()
-            protocol = UV5RMProtocol(transport)
-            ident_result = protocol.identify_radio()
-            transport.close()
+            from baofeng_logo_flasher.protocol import UV5RMTransport, UV5RMProtocol
+
+            with UV5RMTransport(port) as transport:
+                ident_result = UV5RMProtocol(transport).identify_radio()
 
+            # identify_radio() already ran registry detection on the version
+            # bytes while the port was open; no second lookup is needed.
             detected_model_name = ident_result.get("model", model)
             version_bytes = ident_result.get("version")
-            ident_bytes = ident_result.get("ident")
 
             if not output_json:
                 console.print(f"Detected: [cyan]{detected_model_name}[/cyan]")
@@ -424,7 +675,7 @@ def capabilities(
                 console.print()
         except Exception as exc:
             if output_json:
-                console.print(json.dumps({"error": str(exc)}, indent=2))
+                print_json({"error": str(exc)})
                 sys.exit(1)
             print_error(f"Detection failed: {exc}")
             console.print("Falling back to model name lookup...")
@@ -432,78 +683,66 @@ def capabilities(
         if not output_json:
             print_header(f"Capabilities Report: {model}")
 
-    # Try to get model from registry (check both provided name and detected)
-    config = registry_get_model(detected_model_name)
-    if not config and detected_model_name != model:
-        config = registry_get_model(model)
-        detected_model_name = model if config else detected_model_name
-
-    # Also try detection by version bytes
-    if not config and version_bytes:
-        config = registry_detect_model(version_bytes=version_bytes)
-        if config:
-            detected_model_name = config.name
+    # Prefer the detected name, falling back to the one given when only that
+    # is registered. Without live detection they are the same name and
+    # get_capabilities() does the only registry lookup.
+    if (
+        detected_model_name != model
+        and registry_get_model(detected_model_name) is None
+        and registry_get_model(model) is not None
+    ):
+        detected_model_name = model
 
     # Get capabilities report
     caps = registry_get_capabilities(detected_model_name)
 
     if output_json:
-        console.print(json.dumps(caps.to_dict(), indent=2))
+        print_json(caps.to_dict())
         return
 
-    # Display capabilities table
-    table = Table(title=f"Capabilities: {detected_model_name}")
-    table.add_column("Operation", style="cyan")
-    table.add_column("Supported", style="green")
-    table.add_column("Safety", style="yellow")
-    table.add_column("Reason", style="dim")
-
-    safety_styles = {
-        SafetyLevel.SAFE: "[green]Safe[/green]",
-        SafetyLevel.MODERATE: "[yellow]Moderate[/yellow]",
-        SafetyLevel.RISKY: "[red]Risky[/red]",
-    }
-
-    for cap_info in caps.capabilities:
-        supported = "[green]Yes[/green]" if cap_info.supported else "[red]No[/red]"
-        safety = safety_styles.get(cap_info.safety, str(cap_info.safety.value))
-        table.add_row(
-            cap_info.capability.name.replace("_", " ").title(),
-            supported,
-            safety,
-            cap_info.reason,
-        )
+    # Buffer the report (everything after live detection) into one write.
+    with console:
+        # Display capabilities table
+        table = _make_table(f"Capabilities: {detected_model_name}", _CAPABILITY_COLUMNS)
+
+        rows = [
+            (
+                _CAPABILITY_LABELS[cap_info.capability],
+                _SUPPORTED_MARKUP[bool(cap_info.supported)],
+                _SAFETY_STYLES.get(cap_info.safety, str(cap_info.safety.value)),
+                cap_info.reason,
+            )
+            for cap_info in caps.capabilities
+        ]
+        for row in rows:
+            table.add_row(*row)
 
-    console.print(table)
+        console.print(table)
 
-    # Display discovered regions
-    if caps.discovered_regions:
-        console.print()
-        regions_table = Table(title="Logo Regions")
-        regions_table.add_column("Address", style="cyan")
-        regions_table.add_column("Dimensions", style="green")
-        regions_table.add_column("Color Mode", style="magenta")
-        regions_table.add_column("Encrypted", style="red")
-
-        for region in caps.discovered_regions:
-            regions_table.add_row(
-                f"0x{region.start_addr:04X}-0x{region.end_addr:04X}",
-                f"{region.width}x{region.height}",
-                region.color_mode,
-                "Yes" if region.encrypt else "No",
-            )
+        # Display discovered regions
+        if caps.discovered_regions:
+            console.print()
+            regions_table = _make_table("Logo Regions", _REGION_COLUMNS)
 
-        console.print(regions_table)
+            for region in caps.discovered_regions:
+                regions_table.add_row(
+                    _fmt_range(region.start_addr, region.end_addr),
+                    f"{region.width}x{region.height}",
+                    region.color_mode,
+                    "Yes" if region.encrypt else "No",
+                )
 
-    # Display notes
-    if caps.notes:
-        console.print()
-        console.print("[bold]Notes:[/bold]")
-        for note in caps.notes:
-            console.print(f"  • {note}")
+            console.print(regions_table)
+
+        # Display notes
+        if caps.notes:
+            console.print()
+            console.print("[bold]Notes:[/bold]")
+            for note in caps.notes:
+                console.print(f"  • {note}")
 
-    console.print()
-    print_success("Capabilities report complete")
+        console.print()
+        print_success("Capabilities report complete")
 
 
 @app.command()
@@ -516,19 +755,15 @@ def detect(
 
     console.print(f"Port: {port}")
 
-    transport = None
     try:
-        transport = UV5RMTransport(port)
-        transport.open()
-        protocol = UV5RMProtocol(transport)
-        ident_result = protocol.identify_radio()
-        transport.close()
+        from baofeng_logo_flasher.protocol import UV5RMTransport, UV5RMProtocol
+
+        with UV5RMTransport(port) as transport:
+            ident_result = UV5RMProtocol(transport).identify_radio()
 
         model_name = model or ident_result["model"]
 
-        table = Table(title="Radio Identification")
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="green")
+        table = _make_table("Radio Identification", _PROPERTY_COLUMNS)
 
         table.add_row("Model", model_name)
         table.add_row("Firmware", ident_result["version"].decode("latin-1", errors="ignore"))
@@ -573,6 +808,17 @@ def upload_logo_serial(
         "--write-addr-mode",
         help="CMD_WRITE address mode: auto, byte, or chunk",
     ),
+    baud: Optional[int] = typer.Option(
+        None,
+        "--baud",
+        min=1,
+        help="Override the model's serial baud rate",
+    ),
+    low_latency: bool = typer.Option(
+        True,
+        "--low-latency/--no-low-latency",
+        help="Ask the USB-serial driver for low-latency mode (Linux)",
+    ),
 ) -> None:
     """
     Upload logo via A5 serial protocol (UV-5RM/UV-17 family).
@@ -584,66 +830,111 @@ def upload_logo_serial(
     """
     print_header("Upload Logo (Serial A5)")
 
-    if model not in SERIAL_FLASH_CONFIGS:
+    serial_flash_configs = _serial_flash_configs()
+    model = _resolve_model(model) or model
+    if model not in serial_flash_configs:
         print_error(f"Model '{model}' is not in SERIAL_FLASH_CONFIGS")
         sys.exit(1)
 
-    if not Path(image).exists():
-        print_error(f"File not found: {image}")
-        sys.exit(1)
-
-    config = dict(SERIAL_FLASH_CONFIGS[model])
+    # Copied because --baud and --low-latency override fields per run; the
+    # shared SERIAL_FLASH_CONFIGS entry must stay untouched.
+    config = dict(serial_flash_configs[model])
     if config.get("protocol") != "a5_logo":
         print_error(f"Model '{model}' is not configured for A5 logo upload")
         sys.exit(1)
 
-    if write_addr_mode not in {"auto", "byte", "chunk"}:
+    if write_addr_mode not in _WRITE_ADDR_MODES:
         print_error("Invalid --write-addr-mode (use 'auto', 'byte', or 'chunk')")
         sys.exit(1)
 
-    effective_mode = None if write_addr_mode == "auto" else write_addr_mode
+    effective_mode = _WRITE_ADDR_MODES[write_addr_mode]
+    if baud is not None:
+        config["baudrate"] = baud
+    config["low_latency"] = low_latency
+    width, height = config["size"]
+    payload_len = width * height * 2  # RGB565
 
-    if not dry_run:
-        # Reuse standard confirmation UX
-        confirm_write_with_details(
+    if dry_run:
+        safety_ctx = create_cli_safety_context(
+            write_flag=write,
+            model=model,
+            region_known=True,
+            simulate=True,
+            confirmation_token=confirm,
+        )
+    else:
+        # Reuse standard confirmation UX; the confirmed context gates the write.
+        safety_ctx = confirm_write_with_details(
             write_flag=write,
             model=model,
             target_region="A5 logo upload region (device-managed)",
-            bytes_length=config["size"][0] * config["size"][1] * 2,
+            bytes_length=payload_len,
             offset=0,
             confirm_token=confirm,
         )
 
-    safety_ctx = create_cli_safety_context(
-        write_flag=write,
-        model=model,
-        region_known=True,
-        simulate=dry_run,
-        confirmation_token=confirm,
-    )
+    # Opened only after every check above that can exit, so none of them
+    # leaves the handle open; the with block below closes it.
+    image_file = _open_input_file(image)
+
+    # A live bar only helps someone watching a terminal; redirected runs keep
+    # the plain progress log lines.
+    progress = None
+    if console.is_terminal and not dry_run:
+        from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn
+
+        progress = Progress(
+            TextColumn("Writing logo"),
+            BarColumn(),
+            DownloadColumn(),
+            console=console,
+            refresh_per_second=4,
+            transient=True,
+        )
+        progress_task = progress.add_task("write", total=None)
+
+    # Monotonic time of the last bar update. The bar only repaints a few
+    # times a second, so updates in between just contend for its lock.
+    last_update = [float("-inf")]
+    # Last 10% step written to the log when there is no bar.
+    last_logged_step = [-1]
 
     def _progress_cb(done: int, total: int) -> None:
         if total <= 0:
             return
+        if progress is not None:
+            now = time.monotonic()
+            if done < total and now - last_update[0] < 0.1:
+                return
+            last_update[0] = now
+            progress.update(progress_task, completed=done, total=total)
+            return
         pct = int((done / total) * 100)
+        if pct // 10 == last_logged_step[0]:
+            return
+        last_logged_step[0] = pct // 10
         logger.info("Image write progress: %d/%d bytes (%d%%)", done, total, pct)
 
-    result = core_flash_logo_serial(
-        port=port,
-        bmp_path=image,
-        config=config,
-        safety_ctx=safety_ctx,
-        progress_cb=_progress_cb,
-        debug_bytes=debug_bytes,
-        debug_output_dir=debug_dir,
-        write_address_mode=effective_mode,
-    )
+    # Deferred so commands that never touch the serial upload path (--help,
+    # list-models, argument errors above) skip importing it.
+    from baofeng_logo_flasher.core.actions import flash_logo_serial as core_flash_logo_serial
+
+    with image_file, progress if progress is not None else contextlib.nullcontext():
+        result = core_flash_logo_serial(
+            port=port,
+            bmp_path=image_file,
+            config=config,
+            safety_ctx=safety_ctx,
+            progress_cb=_progress_cb,
+            debug_bytes=debug_bytes,
+            debug_output_dir=debug_dir,
+            write_address_mode=effective_mode,
+        )
 
     if not result.ok:
         print_error("\n".join(result.errors) if result.errors else "Serial upload failed")
         if result.logs:
-            for line in result.logs[-20:]:
-                console.print(line, style="dim")
+            console.print(Text("\n".join(result.logs[-20:]), style="dim"))
         sys.exit(1)
 
     print_success(result.metadata.get("result_message", "Serial upload complete"))
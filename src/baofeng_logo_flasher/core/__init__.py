@@ -12,27 +12,37 @@ Both CLI and Streamlit UI should call into this module rather than
 implementing their own logic.
 """
 
-from .safety import SafetyContext, require_write_permission, WritePermissionError
-from .parsing import parse_offset, parse_bitmap_format
-from .results import OperationResult
-from .messages import (
-    MessageLevel,
-    WarningCode,
-    WarningItem,
-    warnings_from_strings,
-    result_to_warnings,
-    COMMON_WARNINGS,
-)
-from .actions import (
-    prepare_logo_bytes,
-    flash_logo_serial,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .safety import (
+        SafetyContext,
+        require_write_permission,
+        WritePermissionError,
+        WriteDenyReason,
+    )
+    from .parsing import parse_offset, parse_bitmap_format
+    from .results import OperationResult
+    from .messages import (
+        MessageLevel,
+        WarningCode,
+        WarningItem,
+        warnings_from_strings,
+        result_to_warnings,
+        COMMON_WARNINGS,
+    )
+    from .actions import (
+        prepare_logo_bytes,
+        flash_logo_serial,
+    )
 
 __all__ = [
     # Safety
     "SafetyContext",
     "require_write_permission",
     "WritePermissionError",
+    "WriteDenyReason",
     # Parsing
     "parse_offset",
     "parse_bitmap_format",
@@ -49,3 +59,37 @@ __all__ = [
     "prepare_logo_bytes",
     "flash_logo_serial",
 ]
+
+# Submodules are imported on first attribute access (PEP 562). parsing and
+# actions pull in PIL and the codec, which importing core.safety alone (as
+# the CLI does) should not pay for.
+_LAZY_EXPORTS = {
+    "SafetyContext": ".safety",
+    "require_write_permission": ".safety",
+    "WritePermissionError": ".safety",
+    "WriteDenyReason": ".safety",
+    "parse_offset": ".parsing",
+    "parse_bitmap_format": ".parsing",
+    "OperationResult": ".results",
+    "MessageLevel": ".messages",
+    "WarningCode": ".messages",
+    "WarningItem": ".messages",
+    "warnings_from_strings": ".messages",
+    "result_to_warnings": ".messages",
+    "COMMON_WARNINGS": ".messages",
+    "prepare_logo_bytes": ".actions",
+    "flash_logo_serial": ".actions",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
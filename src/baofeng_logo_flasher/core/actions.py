@@ -9,8 +9,12 @@ import hashlib
 import logging
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any, Callable
+from typing import BinaryIO, Optional, Tuple, Dict, Any, Callable, Union
 
+from PIL import Image
+
+from ..boot_logo import flash_logo as _flash_logo_impl
+from ..logo_codec import LogoCodec
 from .results import OperationResult
 from .safety import SafetyContext, require_write_permission, WritePermissionError
 from .parsing import parse_bitmap_format
@@ -75,21 +79,20 @@ def prepare_logo_bytes(
         ValueError: If format is invalid
         FileNotFoundError: If input file doesn't exist
     """
-    from baofeng_logo_flasher.logo_codec import LogoCodec
-
-    path = Path(input_image_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Input image not found: {input_image_path}")
-
+    # Get original size for metadata. Opening the file is also the existence
+    # check, so there is no separate stat that could race with the open.
     fmt = parse_bitmap_format(bitmap_format)
     codec = LogoCodec(fmt, dither=dither)
 
-    # Get original size for metadata
-    from PIL import Image
-    with Image.open(input_image_path) as img:
-        original_size = img.size
+    try:
+        img = Image.open(input_image_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input image not found: {input_image_path}")
 
-    logo_bytes = codec.convert_image(input_image_path, target_size)
+    # Hand the open image to the codec so the file is only decoded once
+    with img:
+        original_size = img.size
+        logo_bytes = codec.convert_image(img, target_size)
 
     metadata = {
         "original_size": original_size,
@@ -104,7 +107,7 @@ def prepare_logo_bytes(
 
 def flash_logo_serial(
     port: str,
-    bmp_path: str,
+    bmp_path: Union[str, BinaryIO],
     config: Dict[str, Any],
     safety_ctx: SafetyContext,
     progress_cb: Optional[Callable[[int, int], None]] = None,
@@ -119,7 +122,8 @@ def flash_logo_serial(
 
     Args:
         port: Serial port path
-        bmp_path: Path to BMP file
+        bmp_path: Path to BMP file, or a binary file object holding the
+            image (lets callers with in-memory uploads skip a temp file)
         config: Model config dict from SERIAL_FLASH_CONFIGS
         safety_ctx: Safety context for gating
         progress_cb: Optional progress callback
@@ -131,7 +135,7 @@ def flash_logo_serial(
     Returns:
         OperationResult with flash status
     """
-    if not Path(bmp_path).exists():
+    if isinstance(bmp_path, str) and not Path(bmp_path).exists():
         return OperationResult.failure(
             operation="flash_logo_serial",
             error=f"BMP file not found: {bmp_path}",
@@ -150,8 +154,6 @@ def flash_logo_serial(
         )
 
         try:
-            from baofeng_logo_flasher.boot_logo import flash_logo as _flash_logo_impl
-
             result_str = _flash_logo_impl(
                 port=port,
                 bmp_path=bmp_path,
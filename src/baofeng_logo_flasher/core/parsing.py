@@ -4,6 +4,7 @@ Centralized parsing helpers for offset and bitmap format values.
 Both CLI and Streamlit must import these helpers rather than re-implement.
 """
 
+import functools
 from typing import Optional
 
 from baofeng_logo_flasher.logo_codec import (
@@ -37,6 +38,12 @@ def parse_offset(value: Optional[str]) -> Optional[int]:
     if not value:
         return None
 
+    return _parse_offset_text(value)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_offset_text(value: str) -> int:
+    """Parse a stripped, non-empty offset string (results are memoized)."""
     try:
         # Hex with 0x/0X prefix
         if value.lower().startswith("0x"):
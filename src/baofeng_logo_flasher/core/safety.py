@@ -6,12 +6,25 @@ Streamlit enforce identical safety checks.
 """
 
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import Optional, List, Callable
 
 # Confirmation token required for non-interactive writes
 CONFIRMATION_TOKEN = "WRITE"
 
 
+class WriteDenyReason(Enum):
+    """Stable codes for why require_write_permission denied a write."""
+    NEEDS_WRITE_FLAG = "needs_write_flag"
+    UNKNOWN_MODEL = "unknown_model"
+    UNKNOWN_REGION = "unknown_region"
+    TOKEN_MISMATCH = "token_mismatch"
+    CONFIRMATION_DECLINED = "confirmation_declined"
+    NO_PROMPT_HANDLER = "no_prompt_handler"
+    TOKEN_REQUIRED = "token_required"
+    OTHER = "other"
+
+
 class WritePermissionError(Exception):
     """
     Raised when a write operation is not permitted.
@@ -19,10 +32,17 @@ class WritePermissionError(Exception):
     Attributes:
         reason: Human-readable explanation of why write was denied
         details: Additional context (model, region, etc.)
+        code: WriteDenyReason for callers that branch on the cause
     """
-    def __init__(self, reason: str, details: Optional[dict] = None):
+    def __init__(
+        self,
+        reason: str,
+        details: Optional[dict] = None,
+        code: WriteDenyReason = WriteDenyReason.OTHER,
+    ):
         self.reason = reason
         self.details = details or {}
+        self.code = code
         super().__init__(reason)
 
 
@@ -125,6 +145,7 @@ def require_write_permission(
             "CLI: use --write flag. "
             "UI: acknowledge risk checkbox.",
             details=details,
+            code=WriteDenyReason.NEEDS_WRITE_FLAG,
         )
 
     # Rule 3: Cannot write to unknown model
@@ -133,6 +154,7 @@ def require_write_permission(
             "Cannot write to radio with unknown model. "
             "Identification failed or model not recognized.",
             details=details,
+            code=WriteDenyReason.UNKNOWN_MODEL,
         )
 
     # Rule 4: Cannot write to unknown region (unless explicitly accepted)
@@ -143,6 +165,7 @@ def require_write_permission(
             "Target region is unknown. Provide explicit offset or "
             "use discovery mode with appropriate flags.",
             details=details,
+            code=WriteDenyReason.UNKNOWN_REGION,
         )
 
     # Rule 5: Token-based confirmation for non-interactive
@@ -151,6 +174,7 @@ def require_write_permission(
             raise WritePermissionError(
                 f"Confirmation token mismatch. Expected '{CONFIRMATION_TOKEN}'.",
                 details=details,
+                code=WriteDenyReason.TOKEN_MISMATCH,
             )
         # Token matched, permission granted
         return
@@ -168,6 +192,7 @@ def require_write_permission(
                 raise WritePermissionError(
                     "Confirmation failed. Write aborted by user.",
                     details=details,
+                    code=WriteDenyReason.CONFIRMATION_DECLINED,
                 )
         else:
             # No prompt callback set - we cannot confirm interactively
@@ -175,12 +200,14 @@ def require_write_permission(
                 "Interactive confirmation required but no prompt handler set. "
                 "Provide confirmation_token for non-interactive mode.",
                 details=details,
+                code=WriteDenyReason.NO_PROMPT_HANDLER,
             )
     else:
         # Non-interactive but no token provided
         raise WritePermissionError(
             "Non-interactive mode requires confirmation_token.",
             details=details,
+            code=WriteDenyReason.TOKEN_REQUIRED,
         )
 
 
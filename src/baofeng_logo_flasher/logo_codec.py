@@ -7,7 +7,7 @@ Supports multiple packing formats for flexibility (discovery phase).
 
 import logging
 from enum import Enum
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, Union
 
 import io
 from PIL import Image, ImageOps, ImageDraw
@@ -38,6 +38,9 @@ BITMAP_FORMAT_ALIASES: Dict[str, BitmapFormat] = {
     "page_lsb": BitmapFormat.PAGE_MAJOR_LSB,
 }
 
+# Listed in parse_bitmap_format errors; the alias table is fixed at import.
+_VALID_FORMATS_TEXT = ", ".join(sorted(BITMAP_FORMAT_ALIASES))
+
 
 def parse_bitmap_format(value: str) -> BitmapFormat:
     """
@@ -60,12 +63,12 @@ def parse_bitmap_format(value: str) -> BitmapFormat:
     # Normalize: lowercase, replace hyphens with underscores
     normalized = value.lower().strip().replace("-", "_")
 
-    if normalized in BITMAP_FORMAT_ALIASES:
-        return BITMAP_FORMAT_ALIASES[normalized]
+    fmt = BITMAP_FORMAT_ALIASES.get(normalized)
+    if fmt is not None:
+        return fmt
 
-    valid_formats = ", ".join(sorted(BITMAP_FORMAT_ALIASES.keys()))
     raise ValueError(
-        f"Invalid bitmap format '{value}'. Valid formats: {valid_formats}"
+        f"Invalid bitmap format '{value}'. Valid formats: {_VALID_FORMATS_TEXT}"
     )
 
 
@@ -147,8 +150,9 @@ class LogoCodec:
         if dither:
             mono = img.convert('1', dither=Image.Dither.FLOYDSTEINBERG)
         else:
-            # Simple threshold at 50%
-            mono = img.convert('1')
+            # Simple threshold at 50%. Plain convert('1') would still apply
+            # Floyd-Steinberg, so turn dithering off explicitly.
+            mono = img.convert('1', dither=Image.Dither.NONE)
 
         logger.debug(f"Converted to monochrome: {mono.mode} {mono.size}")
         return mono
@@ -359,25 +363,32 @@ class LogoCodec:
 
     def convert_image(
         self,
-        input_path: str,
+        input_path: Union[str, Image.Image],
         target_size: Tuple[int, int] = (128, 64),
     ) -> bytes:
         """
         Complete pipeline: load → resize → monochrome → pack.
 
         Args:
-            input_path: Path to PNG/JPG file
+            input_path: Path to PNG/JPG file, or an already opened image
+                (resized in place, so callers that have it open for other
+                reasons avoid decoding the file twice)
             target_size: Target (width, height)
 
         Returns:
             Packed bitmap bytes
         """
-        img = self.load_image(input_path)
+        if isinstance(input_path, Image.Image):
+            img = input_path
+            source = "image"
+        else:
+            img = self.load_image(input_path)
+            source = input_path
         img = self.resize_image(img, target_size)
         img = self.to_monochrome(img, self.dither)
         data = self.pack(img)
 
-        logger.info(f"Converted {input_path} to {len(data)} packed bytes "
+        logger.info(f"Converted {source} to {len(data)} packed bytes "
                     f"({target_size[0]}x{target_size[1]} {self.format.value})")
 
         return data
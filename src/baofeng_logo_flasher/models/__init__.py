@@ -20,6 +20,7 @@ from .registry import (
     get_models_by_protocol,
     get_serial_flash_config,
     get_all_serial_flash_configs,
+    invalidate_registry_caches,
 )
 
 __all__ = [
@@ -38,4 +39,5 @@ __all__ = [
     "get_models_by_protocol",
     "get_serial_flash_config",
     "get_all_serial_flash_configs",
+    "invalidate_registry_caches",
 ]
@@ -25,6 +25,7 @@ Usage:
     caps = get_capabilities("UV-5RM")
 """
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, List, Optional, Tuple
@@ -282,7 +283,24 @@ def list_models() -> List[str]:
     Returns:
         Sorted list of model names.
     """
-    return sorted(_MODEL_REGISTRY.keys())
+    return list(_sorted_model_names())
+
+
+@functools.lru_cache(maxsize=None)
+def _sorted_model_names() -> Tuple[str, ...]:
+    return tuple(sorted(_MODEL_REGISTRY))
+
+
+def invalidate_registry_caches() -> None:
+    """
+    Drop memoized registry lookups.
+
+    The registry is filled once at import, so this is only needed by code
+    (typically tests) that registers models afterwards.
+    """
+    _sorted_model_names.cache_clear()
+    _detect_model_cached.cache_clear()
+    _registry_capabilities.cache_clear()
 
 
 def get_model(name: str) -> Optional[ModelConfig]:
@@ -316,6 +334,19 @@ def detect_model(
     Returns:
         Best matching ModelConfig, or None if no match.
     """
+    # The registry is fixed after import, so results only depend on the
+    # (hashable) byte strings. ident_bytes does not take part in matching.
+    return _detect_model_cached(
+        bytes(version_bytes) if version_bytes else None,
+        bytes(magic_used) if magic_used else None,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _detect_model_cached(
+    version_bytes: Optional[bytes],
+    magic_used: Optional[bytes],
+) -> Optional[ModelConfig]:
     if version_bytes:
         # Try to match firmware version patterns
         for config in _MODEL_REGISTRY.values():
@@ -347,6 +378,35 @@ def get_capabilities(
     Returns:
         ModelCapabilities report with supported operations and reasons.
     """
+    if not discovered_regions:
+        # Registry-only reports never change; rebuild just the containers so
+        # callers cannot mutate the cached copy.
+        caps, regions, notes = _registry_capabilities(model_name)
+        return ModelCapabilities(
+            model_name=model_name,
+            capabilities=list(caps),
+            discovered_regions=list(regions),
+            notes=list(notes),
+        )
+    return _build_capabilities(model_name, discovered_regions)
+
+
+@functools.lru_cache(maxsize=64)
+def _registry_capabilities(
+    model_name: str,
+) -> Tuple[Tuple[CapabilityInfo, ...], Tuple[LogoRegion, ...], Tuple[str, ...]]:
+    report = _build_capabilities(model_name, None)
+    return (
+        tuple(report.capabilities),
+        tuple(report.discovered_regions),
+        tuple(report.notes),
+    )
+
+
+def _build_capabilities(
+    model_name: str,
+    discovered_regions: Optional[List[LogoRegion]],
+) -> ModelCapabilities:
     config = get_model(model_name)
 
     if config is None:
@@ -17,12 +17,14 @@ Protocol sequence:
 7. Send completion frame (cmd 0x06) with "Over" → expect 0x00
 """
 
+import binascii
 import hashlib
 import json
 import logging
+import struct
 import time
 from pathlib import Path
-from typing import Optional, Callable, Tuple, List, Literal
+from typing import BinaryIO, Optional, Callable, Tuple, List, Literal, Union
 
 try:
     import serial
@@ -65,7 +67,7 @@ class LogoProtocolError(Exception):
     """Errors raised by logo protocol operations."""
 
 
-def crc16_xmodem(data: bytes) -> int:
+def crc16_xmodem(data: bytes, crc: int = 0) -> int:
     """
     Calculate CRC16-XMODEM checksum.
 
@@ -75,20 +77,19 @@ def crc16_xmodem(data: bytes) -> int:
 
     Args:
         data: Bytes to calculate checksum over (excluding 0xA5 prefix)
+        crc: Running CRC to continue from (lets callers checksum a frame
+            piecewise without concatenating it first)
 
     Returns:
         16-bit CRC value
     """
-    crc = 0
-    for byte in data:
-        crc ^= byte << 8
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ 0x1021
-            else:
-                crc <<= 1
-            crc &= 0xFFFF
-    return crc
+    # binascii.crc_hqx is CRC-CCITT (poly 0x1021, MSB first, no reflection or
+    # final XOR); with a zero initial value that is exactly CRC16-XMODEM.
+    return binascii.crc_hqx(data, crc)
+
+
+# 0xA5, cmd, big-endian 16-bit address, big-endian 16-bit payload length
+_FRAME_HEADER = struct.Struct(">BBHH")
 
 
 def build_frame(cmd: int, addr: int, payload: bytes) -> bytes:
@@ -109,19 +110,20 @@ def build_frame(cmd: int, addr: int, payload: bytes) -> bytes:
     Returns:
         Complete frame as bytes
     """
-    frame = bytearray([0xA5, cmd])
-    frame.append((addr >> 8) & 0xFF)  # addr high
-    frame.append(addr & 0xFF)          # addr low
-    frame.append((len(payload) >> 8) & 0xFF)  # len high
-    frame.append(len(payload) & 0xFF)         # len low
-    frame.extend(payload)
-
-    # Calculate CRC16-XMODEM over all bytes after 0xA5
-    crc = crc16_xmodem(bytes(frame[1:]))  # Skip 0xA5
+    # Allocate the whole frame once and fill it in place, so the frame goes
+    # to the port as a single write.
+    length = len(payload)
+    frame = bytearray(_FRAME_HEADER.size + length + 2)
+    _FRAME_HEADER.pack_into(frame, 0, 0xA5, cmd, addr & 0xFFFF, length)
+    frame[_FRAME_HEADER.size:_FRAME_HEADER.size + length] = payload
+
+    # CRC16-XMODEM over all bytes after 0xA5 (header, then payload)
+    header = memoryview(frame)[1:_FRAME_HEADER.size]
+    crc = crc16_xmodem(payload, crc16_xmodem(header))
+    header.release()
 
     # Append CRC in big-endian order
-    frame.append((crc >> 8) & 0xFF)   # CRC high byte
-    frame.append(crc & 0xFF)           # CRC low byte
+    struct.pack_into(">H", frame, _FRAME_HEADER.size + length, crc)
 
     return bytes(frame)
 
@@ -209,8 +211,15 @@ def rgb888_to_rgb565(r: int, g: int, b: int) -> int:
     return (r5 << 11) | (g6 << 5) | b5
 
 
+# Per-channel lookup tables for packing 8-bit channels into 565 byte halves
+_LUT_HIGH_TOP = [v & 0xF8 for v in range(256)]  # top 5 bits -> high byte [7:3]
+_LUT_G_HIGH = [v >> 5 for v in range(256)]  # green [7:5] -> high byte [2:0]
+_LUT_G_LOW = [((v >> 2) & 0x07) << 5 for v in range(256)]  # green [4:2] -> low byte [7:5]
+_LUT_LOW_BOTTOM = [v >> 3 for v in range(256)]  # top 5 bits -> low byte [4:0]
+
+
 def convert_image_to_rgb565(
-    image_path: str,
+    image_path: Union[str, BinaryIO],
     size: Tuple[int, int] = (160, 128),
     pixel_order: Literal["rgb", "bgr"] = "rgb",
 ) -> bytes:
@@ -218,41 +227,37 @@ def convert_image_to_rgb565(
     Convert an image file to 565 format suitable for the radio.
 
     Args:
-        image_path: Path to image file (PNG, JPG, BMP, etc.)
+        image_path: Path to image file (PNG, JPG, BMP, etc.) or an open
+            binary file object holding one
         size: Target dimensions (width, height)
         pixel_order: 16-bit channel order ("rgb" for RGB565, "bgr" for BGR565)
 
     Returns:
         Raw 565 bytes in little-endian format
     """
-    from PIL import Image
+    from PIL import Image, ImageChops
+
+    if pixel_order not in {"rgb", "bgr"}:
+        raise ValueError(f"Unsupported pixel_order: {pixel_order}")
 
     img = Image.open(image_path)
     img = img.convert("RGB")
     img = img.resize(size, Image.Resampling.LANCZOS)
 
-    if pixel_order not in {"rgb", "bgr"}:
-        raise ValueError(f"Unsupported pixel_order: {pixel_order}")
-
-    # No vertical flip - radio reads top-to-bottom
-    # Convert to 565 little-endian
-    raw_data = bytearray()
-    for y in range(size[1]):
-        for x in range(size[0]):
-            r, g, b = img.getpixel((x, y))
-            if pixel_order == "rgb":
-                val565 = rgb888_to_rgb565(r, g, b)
-            else:
-                # BGR565: BBBBBGGGGGGRRRRR
-                r5 = (r >> 3) & 0x1F
-                g6 = (g >> 2) & 0x3F
-                b5 = (b >> 3) & 0x1F
-                val565 = (b5 << 11) | (g6 << 5) | r5
-            # Little-endian: low byte first
-            raw_data.append(val565 & 0xFF)
-            raw_data.append((val565 >> 8) & 0xFF)
+    # No vertical flip - radio reads top-to-bottom.
+    # Pack all pixels with per-channel lookup tables in Pillow's C code rather
+    # than a per-pixel Python loop. For RGB565 (RRRRRGGG GGGBBBBB):
+    #   high byte = R[7:3] << 3 | G[7:5]
+    #   low byte  = G[4:2] << 5 | B[7:3]
+    # BGR565 is the same layout with the red and blue channels swapped.
+    r, g, b = img.split()
+    if pixel_order == "bgr":
+        r, b = b, r
+    high = ImageChops.add(r.point(_LUT_HIGH_TOP), g.point(_LUT_G_HIGH))
+    low = ImageChops.add(g.point(_LUT_G_LOW), b.point(_LUT_LOW_BOTTOM))
 
-    return bytes(raw_data)
+    # "LA" interleaves the two bands per pixel: low byte first (little-endian)
+    return Image.merge("LA", (low, high)).tobytes()
 
 
 def render_rgb565_payload_row_major(
@@ -316,12 +321,16 @@ def dump_logo_debug_artifacts(
     payload_path = out_dir / "image_payload.bin"
     payload_path.write_bytes(image_data)
 
-    frame_payload_stream = b"".join(chunk for _, chunk, _ in write_frames)
+    # Stream the frames to disk and hash payload chunks as they are written,
+    # rather than joining the whole stream first and hashing it afterwards
+    frame_payload_hash = hashlib.sha256()
     frame_payload_path = out_dir / "write_payload_stream.bin"
-    frame_payload_path.write_bytes(frame_payload_stream)
-
     frames_path = out_dir / "write_frames.bin"
-    frames_path.write_bytes(b"".join(frame for _, _, frame in write_frames))
+    with frame_payload_path.open("wb") as payload_out, frames_path.open("wb") as frames_out:
+        for _, chunk, frame in write_frames:
+            payload_out.write(chunk)
+            frame_payload_hash.update(chunk)
+            frames_out.write(frame)
 
     preview_path = out_dir / "preview_row_major.png"
     render_rgb565_payload_row_major(
@@ -339,7 +348,7 @@ def dump_logo_debug_artifacts(
         "frame_count": len(write_frames),
         "first_offsets": [offset for offset, _, _ in write_frames[:8]],
         "payload_sha256": hashlib.sha256(image_data).hexdigest(),
-        "frame_payload_sha256": hashlib.sha256(frame_payload_stream).hexdigest(),
+        "frame_payload_sha256": frame_payload_hash.hexdigest(),
         "first_bytes_hex": image_data[:max_hex_bytes].hex(),
     }
     manifest_path = out_dir / "manifest.json"
@@ -357,6 +366,7 @@ class LogoUploader:
         port: str,
         baudrate: int = BAUD_RATE,
         timeout: float = 2.0,
+        low_latency: bool = True,
     ):
         """
         Initialize uploader.
@@ -365,6 +375,7 @@ class LogoUploader:
             port: Serial port path
             baudrate: Baud rate (default 115200)
             timeout: Read timeout in seconds
+            low_latency: Request driver low-latency mode on open
         """
         if serial is None:
             raise LogoProtocolError("PySerial not installed")
@@ -372,6 +383,7 @@ class LogoUploader:
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.low_latency = low_latency
         self.ser: "serial.Serial | None" = None
 
     def open(self) -> None:
@@ -389,6 +401,11 @@ class LogoUploader:
         self.ser.dtr = True
         self.ser.rts = True
 
+        from .uv5rm_transport import enable_low_latency, enlarge_buffers
+        if self.low_latency:
+            enable_low_latency(self.ser)
+        enlarge_buffers(self.ser)
+
         # Clear any stale data
         time.sleep(0.1)
         self.ser.reset_input_buffer()
@@ -404,9 +421,10 @@ class LogoUploader:
         logger.debug(f"Opened {self.port} at {self.baudrate} baud")
 
     def close(self) -> None:
-        """Close serial connection."""
-        if self.ser and self.ser.is_open:
-            self.ser.close()
+        """Close serial connection. Safe to call more than once."""
+        ser, self.ser = self.ser, None
+        if ser is not None and ser.is_open:
+            ser.close()
             logger.debug(f"Closed {self.port}")
 
     def _send(self, data: bytes) -> None:
@@ -554,19 +572,20 @@ class LogoUploader:
                 CHUNK_SIZE,
             )
 
-        for offset, chunk in chunk_image_data(
-            image_data,
-            chunk_size=CHUNK_SIZE,
-            pad_last_chunk=False,
-        ):
+        # Slice chunks out of a view of the payload: build_frame copies each
+        # chunk straight into its frame, so no per-chunk bytes are created.
+        # Same (offset, chunk) sequence as chunk_image_data(pad_last_chunk=False).
+        view = memoryview(image_data)
+        for offset in range(0, total, CHUNK_SIZE):
+            chunk = view[offset:offset + CHUNK_SIZE]
             write_addr = _calc_write_addr(offset, CHUNK_SIZE, address_mode)
 
             # Build frame with address offset
             frame = build_frame(CMD_WRITE, write_addr, chunk)
             self._send(frame)
-            time.sleep(0.01)
 
-            # Wait for data ACK
+            # Wait for data ACK. The read blocks until the ACK arrives, so no
+            # fixed settle delay is needed; the ACK is what gates the next frame.
             # Expected: A5 EE ... (data ACK) OR A5 57 ... 59 (write echo with 'Y')
             response = self._recv(9)
             if len(response) < 7:
@@ -620,7 +639,7 @@ class LogoUploader:
 
     def upload_logo(
         self,
-        image_path: str,
+        image_path: Union[str, BinaryIO],
         progress_cb: Optional[Callable[[int, int], None]] = None,
         debug_bytes: bool = False,
         debug_output_dir: Optional[str] = None,
@@ -631,7 +650,8 @@ class LogoUploader:
         Complete logo upload workflow.
 
         Args:
-            image_path: Path to image file (any format PIL can read)
+            image_path: Path to image file (any format PIL can read) or a
+                binary file object holding one
             progress_cb: Optional progress callback(bytes_sent, total_bytes)
 
         Returns:
@@ -704,22 +724,26 @@ class LogoUploader:
 
 def upload_logo(
     port: str,
-    image_path: str,
+    image_path: Union[str, BinaryIO],
     progress_cb: Optional[Callable[[int, int], None]] = None,
     simulate: bool = False,
     debug_bytes: bool = False,
     debug_output_dir: Optional[str] = None,
     address_mode: Literal["byte", "chunk"] = "byte",
     pixel_order: Literal["rgb", "bgr"] = "rgb",
+    baudrate: int = BAUD_RATE,
+    low_latency: bool = True,
 ) -> str:
     """
     Convenience function to upload a boot logo.
 
     Args:
         port: Serial port path
-        image_path: Path to image file
+        image_path: Path to image file, or a binary file object holding one
         progress_cb: Optional progress callback
         simulate: If True, skip actual upload
+        baudrate: Serial baud rate (default 115200)
+        low_latency: Request driver low-latency mode (default True)
 
     Returns:
         Success/status message
@@ -733,7 +757,7 @@ def upload_logo(
             f"to {port} as {IMAGE_WIDTH}x{IMAGE_HEIGHT} RGB565"
         )
 
-    uploader = LogoUploader(port)
+    uploader = LogoUploader(port, baudrate=baudrate, low_latency=low_latency)
     return uploader.upload_logo(
         image_path,
         progress_cb,
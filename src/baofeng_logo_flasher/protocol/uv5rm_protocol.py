@@ -12,8 +12,9 @@ This module provides:
 - Dropped-byte detection and workaround
 """
 
+import io
 import logging
-from typing import Optional, Tuple, List, Dict
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 from .uv5rm_transport import (
@@ -70,6 +71,11 @@ class UV5RMProtocol:
         radio.upload_clone(clone_data)
     """
 
+    # Largest block the radio answers per 'S' read request, and the block
+    # size used for 'X' writes (CHIRP-compatible clone framing).
+    MAX_READ_BLOCK_SIZE = 0x40
+    WRITE_BLOCK_SIZE = 0x10
+
     # Magic bytes for various models
     MAGIC_BYTES = {
         'UV5R_ORIG': b"\x50\xBB\xFF\x01\x25\x98\x4D",
@@ -272,6 +278,31 @@ class UV5RMProtocol:
         Returns:
             Complete memory image (6150 - 6408 bytes depending on model)
 
+        Raises:
+            RadioBlockError: If read fails
+        """
+        buf = io.BytesIO()
+        self.download_clone_to(buf)
+        return buf.getvalue()
+
+    def download_clone_to(
+        self,
+        writer: BinaryIO,
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """
+        Stream the memory image to a binary writer as blocks arrive.
+
+        Produces the same bytes as download_clone() without holding the whole
+        image in memory, e.g. when writing straight to an open file.
+
+        Args:
+            writer: Binary file-like object to receive the image
+            progress_cb: Optional callback(bytes_done, total_bytes)
+
+        Returns:
+            Number of bytes written
+
         Raises:
             RadioBlockError: If read fails
         """
@@ -281,43 +312,50 @@ class UV5RMProtocol:
         if self._radio_ident is None:
             self.identify_radio()
 
-        data = self._radio_ident if self._radio_ident else b""
+        ident = self._radio_ident if self._radio_ident else b""
+        main_range = (0x0000, 0x1800, self.MAX_READ_BLOCK_SIZE)
+        if self._has_dropped_byte:
+            # Workaround: 0x1EC0 - 0x1FC0 in 0x40-byte blocks, then
+            # 0x1FC0 - 0x2000 in 0x10-byte blocks
+            aux_ranges = [
+                (0x1EC0, 0x1FC0, self.MAX_READ_BLOCK_SIZE),
+                (0x1FC0, 0x2000, 0x10),
+            ]
+        else:
+            # Standard: read entire aux range in 0x40-byte blocks
+            aux_ranges = [(0x1EC0, 0x2000, self.MAX_READ_BLOCK_SIZE)]
+
+        total = len(ident) + sum(end - start for start, end, _ in [main_range] + aux_ranges)
+        writer.write(ident)
+        done = len(ident)
+
+        def _copy(start: int, end: int, block_size: int, first_block: bool = False) -> None:
+            nonlocal done
+            for block in self._iter_range(start, end, block_size, first_block):
+                writer.write(block)
+                done += len(block)
+                if progress_cb:
+                    progress_cb(done, total)
 
         # Read main memory (0x0000 - 0x1808 in 0x40-byte blocks)
         logger.info("Reading main memory...")
-        for addr in range(0x0000, 0x1800, 0x40):
-            block = self.transport.read_block(addr, 0x40, first_block=(addr == 0x0000))
-            data += block
-
-            # Progress
-            pct = (addr / 0x1800) * 100
-            if addr % 0x100 == 0:
-                logger.debug(f"Main memory: {pct:.1f}%")
+        _copy(*main_range, first_block=True)
 
         # Read auxiliary memory (0x1EC0 - 0x2000)
         logger.info("Reading auxiliary memory...")
+        for aux_range in aux_ranges:
+            _copy(*aux_range)
 
-        if self._has_dropped_byte:
-            # Workaround: use smaller blocks for final range
-            # Read 0x1EC0 - 0x1FC0 in 0x40-byte blocks
-            for addr in range(0x1EC0, 0x1FC0, 0x40):
-                block = self.transport.read_block(addr, 0x40)
-                data += block
-
-            # Read 0x1FC0 - 0x2000 in 0x10-byte blocks
-            for addr in range(0x1FC0, 0x2000, 0x10):
-                block = self.transport.read_block(addr, 0x10)
-                data += block
-        else:
-            # Standard: read entire aux range in 0x40-byte blocks
-            for addr in range(0x1EC0, 0x2000, 0x40):
-                block = self.transport.read_block(addr, 0x40)
-                data += block
-
-        logger.info(f"Download complete: {len(data)} bytes")
-        return data
+        logger.info(f"Download complete: {done} bytes")
+        return done
 
-    def upload_clone(self, image_data: bytes) -> None:
+    def upload_clone(
+        self,
+        image_data: bytes,
+        verify: bool = False,
+        skip_unchanged: bool = False,
+        verify_block_size: Optional[int] = None,
+    ) -> None:
         """
         Upload memory image to radio.
 
@@ -329,9 +367,17 @@ class UV5RMProtocol:
 
         Args:
             image_data: Complete memory image (must be valid for radio model)
+            verify: Read each block back right after writing it and abort on
+                the first mismatch (instead of a separate verify_clone pass)
+            skip_unchanged: Read each block first and only write it when the
+                radio contents differ (an unchanged block costs one read)
+            verify_block_size: With verify, read back this many bytes at a
+                time (clamped to MAX_READ_BLOCK_SIZE) instead of one read per
+                written block, e.g. MAX_READ_BLOCK_SIZE for a quarter of the
+                verify round trips. A mismatch aborts once its span is read.
 
         Raises:
-            RadioBlockError: If write fails or image incompatible
+            RadioBlockError: If write fails, readback differs, or image incompatible
             ValueError: If image format invalid
         """
         if len(image_data) < 0x1808:
@@ -346,42 +392,111 @@ class UV5RMProtocol:
         if self._radio_ident is None:
             self.identify_radio()
 
-        # Extract image ident and main memory
-        image_ident = image_data[0:8]
-        image_main = image_data[8:8 + 0x1800]
-        image_aux = image_data[8 + 0x1800:] if len(image_data) > (8 + 0x1800) else b""
+        # Views share the caller's buffer, so per-block slices are zero-copy
+        view = memoryview(image_data)
+        step = self.WRITE_BLOCK_SIZE
+        written = 0
 
-        # Write main memory (0x0000 - 0x1800 in 0x10-byte chunks)
-        logger.info("Writing main memory...")
-        for addr in range(0x0000, 0x1800, 0x10):
-            chunk = image_main[addr:addr + 0x10]
-            self.transport.write_block(addr, chunk)
+        schedule = self._upload_schedule(len(image_data))
+        aux_blocks = sum(1 for addr, _ in schedule if addr >= 0x1800)
+        logger.info(
+            f"Writing {len(schedule) - aux_blocks} main and "
+            f"{aux_blocks} auxiliary memory blocks..."
+        )
+        # Batched verify: collect contiguous written blocks into one span
+        # and read the span back with a single request
+        verify_span = 0
+        if verify and verify_block_size:
+            verify_span = min(verify_block_size, self.MAX_READ_BLOCK_SIZE)
+        span_addr = span_offset = span_len = 0
+
+        for addr, offset in schedule:
+            chunk = view[offset:offset + step]
+            written += self._write_block_checked(
+                addr, chunk, verify and not verify_span, skip_unchanged
+            )
+
+            if verify_span:
+                # Dropped-byte radios misread the aux tail in large blocks
+                limit = step if self._has_dropped_byte and addr >= 0x1FC0 else verify_span
+                if span_len and (addr != span_addr + span_len or span_len + len(chunk) > limit):
+                    self._check_readback(span_addr, view[span_offset:span_offset + span_len])
+                    span_len = 0
+                if not span_len:
+                    span_addr, span_offset = addr, offset
+                span_len += len(chunk)
 
             # Progress
-            pct = (addr / 0x1800) * 100
-            if addr % 0x100 == 0:
-                logger.debug(f"Main memory: {pct:.1f}%")
-
-        # Write auxiliary memory if present
-        if image_aux:
-            logger.info("Writing auxiliary memory...")
-
-            if self._has_dropped_byte:
-                # Workaround: use 0x10-byte blocks for sensitive range
-                for addr in range(0x1FC0, 0x2000, 0x10):
-                    offset = addr - 0x1EC0
-                    if offset < len(image_aux):
-                        chunk = image_aux[offset:offset + 0x10]
-                        self.transport.write_block(addr, chunk)
-            else:
-                # Standard: use 0x10-byte blocks for all aux memory
-                for addr in range(0x1EC0, 0x2000, 0x10):
-                    offset = addr - 0x1EC0
-                    if offset < len(image_aux):
-                        chunk = image_aux[offset:offset + 0x10]
-                        self.transport.write_block(addr, chunk)
-
-        logger.info("Upload complete")
+            if addr < 0x1800 and addr % 0x100 == 0:
+                logger.debug(f"Main memory: {(addr / 0x1800) * 100:.1f}%")
+
+        if span_len:
+            self._check_readback(span_addr, view[span_offset:span_offset + span_len])
+
+        logger.info(f"Upload complete ({written} blocks written)")
+
+    def _upload_schedule(self, image_len: int) -> List[Tuple[int, int]]:
+        """
+        Build the (radio address, image offset) list for a clone upload.
+
+        Main memory (0x0000 - 0x1800) maps to image[8:]; auxiliary memory
+        follows it in the image starting at radio 0x1EC0. Radios with the
+        dropped-byte issue only get the 0x1FC0 - 0x2000 tail of aux memory
+        written. Aux blocks past the end of the image are skipped.
+        """
+        step = self.WRITE_BLOCK_SIZE
+        schedule = [(addr, 8 + addr) for addr in range(0x0000, 0x1800, step)]
+
+        aux_base = 8 + 0x1800
+        aux_start = 0x1FC0 if self._has_dropped_byte else 0x1EC0
+        for addr in range(aux_start, 0x2000, step):
+            offset = aux_base + (addr - 0x1EC0)
+            if offset < image_len:
+                schedule.append((addr, offset))
+
+        return schedule
+
+    def _write_block_checked(
+        self,
+        addr: int,
+        chunk: bytes,
+        verify: bool,
+        skip_unchanged: bool = False,
+    ) -> bool:
+        """
+        Write one block, optionally reading it straight back to compare.
+
+        Returns:
+            False if the block already matched and the write was skipped
+        """
+        if skip_unchanged and self.transport.read_block(addr, len(chunk)) == chunk:
+            return False
+
+        self.transport.write_block(addr, chunk)
+        if verify:
+            self._check_readback(addr, chunk)
+        return True
+
+    def _check_readback(self, addr: int, expected: bytes) -> None:
+        """
+        Read expected's span back from addr and compare it.
+
+        Raises:
+            RadioBlockError: Naming the first mismatching write block
+        """
+        readback = self.transport.read_block(addr, len(expected))
+        if readback == expected:
+            return
+
+        step = self.WRITE_BLOCK_SIZE
+        for start in range(0, len(expected), step):
+            wrote = bytes(expected[start:start + step])
+            read = readback[start:start + step]
+            if read != wrote:
+                raise RadioBlockError(
+                    f"Verify failed at {addr + start:04X}: "
+                    f"wrote {wrote.hex()}, read {read.hex()}"
+                )
 
     def read_block(self, addr: int, size: int) -> bytes:
         """
@@ -396,6 +511,48 @@ class UV5RMProtocol:
         """
         return self.transport.read_block(addr, size)
 
+    def read_range(
+        self,
+        start: int,
+        end: int,
+        block_size: int = MAX_READ_BLOCK_SIZE,
+        first_block: bool = False,
+    ) -> bytes:
+        """
+        Read a contiguous memory range from radio.
+
+        Args:
+            start: First address to read
+            end: End address (exclusive)
+            block_size: Bytes per read request, clamped to MAX_READ_BLOCK_SIZE
+                (last block is truncated to end)
+            first_block: True if the first request opens the read session
+                (skips the initial ACK wait, see UV5RMTransport.read_block)
+
+        Returns:
+            Bytes from memory, len == end - start
+
+        Raises:
+            RadioBlockError: If any block read fails
+        """
+        return b"".join(self._iter_range(start, end, block_size, first_block))
+
+    def _iter_range(
+        self,
+        start: int,
+        end: int,
+        block_size: int = MAX_READ_BLOCK_SIZE,
+        first_block: bool = False,
+    ) -> Iterator[bytes]:
+        """Yield the blocks of read_range() one at a time as they are read."""
+        block_size = min(block_size, self.MAX_READ_BLOCK_SIZE)
+        for addr in range(start, end, block_size):
+            size = min(block_size, end - addr)
+            yield self.transport.read_block(addr, size, first_block=(first_block and addr == start))
+
+            if (addr - start) % 0x100 == 0:
+                logger.debug(f"Read {addr:04X}: {(addr - start) / (end - start) * 100:.1f}%")
+
     def write_block(self, addr: int, data: bytes) -> None:
         """
         Write a memory block to radio.
@@ -410,6 +567,7 @@ class UV5RMProtocol:
         self,
         image_data: bytes,
         ranges: Optional[List[Tuple[int, int]]] = None,
+        fail_fast: bool = False,
     ) -> Dict:
         """
         Verify that radio memory matches image data.
@@ -426,6 +584,7 @@ class UV5RMProtocol:
             image_data: Reference image to verify against (includes 8-byte ident prefix)
             ranges: List of (start, end) address ranges to verify
                     If None, verifies standard memory ranges
+            fail_fast: Stop reading at the first mismatching block
 
         Returns:
             Dict with verification results:
@@ -447,17 +606,25 @@ class UV5RMProtocol:
         errors = []
         total_bytes = 0
 
+        # Compare each block in place against a view of the reference image,
+        # without copying slices of it
+        view = memoryview(image_data)
+
         for start, end in ranges:
+            if fail_fast and errors:
+                break
             try:
-                for addr in range(start, end, 0x40):
-                    size = min(0x40, end - addr)
+                for addr in range(start, end, self.MAX_READ_BLOCK_SIZE):
+                    size = min(self.MAX_READ_BLOCK_SIZE, end - addr)
                     radio_data = self.transport.read_block(addr, size)
 
                     # Clone image has 8-byte ident prefix, so add IDENT_SIZE to get
                     # the correct offset into the image data for this radio address
                     img_offset = addr + IDENT_SIZE
 
-                    ref_data = image_data[img_offset:img_offset + size]
+                    ref_data = view[img_offset:img_offset + size]
+
+                    total_bytes += size
 
                     if radio_data != ref_data:
                         errors.append({
@@ -466,8 +633,8 @@ class UV5RMProtocol:
                             'radio': radio_data.hex(),
                             'reference': ref_data.hex(),
                         })
-
-                    total_bytes += size
+                        if fail_fast:
+                            break
             except RadioBlockError as e:
                 errors.append({
                     'error': str(e),
@@ -39,6 +39,60 @@ class RadioBlockError(RadioTransportError):
     pass
 
 
+def enable_low_latency(ser: "serial.Serial") -> bool:
+    """
+    Ask the USB-serial driver to deliver received bytes immediately.
+
+    FTDI-class adapters batch input for up to 16 ms by default, which is
+    added to every request/ACK round trip. pyserial exposes the Linux
+    ASYNC_LOW_LATENCY flag as ``set_low_latency_mode``; other platforms
+    keep their driver defaults.
+
+    Returns:
+        True if low-latency mode was enabled
+    """
+    set_low_latency_mode = getattr(ser, "set_low_latency_mode", None)
+    if set_low_latency_mode is None:
+        logger.debug("Low-latency serial mode not supported on this platform")
+        return False
+    try:
+        set_low_latency_mode(True)
+    except (ValueError, OSError) as e:
+        logger.info(f"Could not enable low-latency mode on {ser.port}: {e}")
+        return False
+    logger.debug(f"Enabled low-latency mode on {ser.port}")
+    return True
+
+
+# Driver queue size requested on platforms that let us choose it. A full A5
+# logo frame is ~1 KiB, so 32 KiB keeps several frames and their ACKs queued
+# without the driver splitting writes.
+SERIAL_BUFFER_SIZE = 32768
+
+
+def enlarge_buffers(ser: "serial.Serial", size: int = SERIAL_BUFFER_SIZE) -> bool:
+    """
+    Enlarge the driver's receive/transmit queues where pyserial allows it.
+
+    Only the Windows backend exposes ``set_buffer_size``; its default 4 KiB
+    queues are the same order as a single logo frame. POSIX drivers size
+    their own queues, so the call is skipped there.
+
+    Returns:
+        True if the buffer sizes were applied
+    """
+    set_buffer_size = getattr(ser, "set_buffer_size", None)
+    if set_buffer_size is None:
+        return False
+    try:
+        set_buffer_size(rx_size=size, tx_size=size)
+    except (ValueError, OSError) as e:
+        logger.info(f"Could not resize serial buffers on {ser.port}: {e}")
+        return False
+    logger.debug(f"Serial buffers on {ser.port} set to {size} bytes")
+    return True
+
+
 class UV5RMTransport:
     """
     Low-level serial transport for UV-5R/UV-5RM radios.
@@ -56,6 +110,12 @@ class UV5RMTransport:
         data = transport.read_block(address=0x0000, size=64)
         transport.write_block(address=0x0000, data=data)
         transport.close()
+
+    The transport is also a context manager that opens the port on entry
+    and always closes it on exit:
+
+        with UV5RMTransport(port="/dev/ttyUSB0") as transport:
+            ident = transport.handshake(magic_bytes)
     """
     
     def __init__(
@@ -64,6 +124,7 @@ class UV5RMTransport:
         baudrate: int = 9600,
         timeout: float = 1.5,
         rtscts: bool = True,
+        low_latency: bool = True,
     ):
         """
         Initialize transport layer.
@@ -73,11 +134,13 @@ class UV5RMTransport:
             baudrate: Serial baud rate (default 9600)
             timeout: Read/write timeout in seconds (default 1.5)
             rtscts: Enable RTS/CTS hardware flow control (default True)
+            low_latency: Request driver low-latency mode on open (default True)
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.rtscts = rtscts
+        self.low_latency = low_latency
         self.ser: Optional[serial.Serial] = None
     
     def open(self) -> None:
@@ -100,6 +163,9 @@ class UV5RMTransport:
             )
             self.ser.rts = True
             self.ser.dtr = True
+            if self.low_latency:
+                enable_low_latency(self.ser)
+            enlarge_buffers(self.ser)
             
             # Clear any junk in buffer
             self.ser.reset_input_buffer()
@@ -113,11 +179,20 @@ class UV5RMTransport:
             raise RadioTransportError(f"Cannot open port {self.port}: {e}")
     
     def close(self) -> None:
-        """Close serial port."""
-        if self.ser and self.ser.is_open:
-            self.ser.close()
+        """Close serial port and release the handle. Safe to call more than once."""
+        ser, self.ser = self.ser, None
+        if ser is not None and ser.is_open:
+            ser.close()
             logger.debug(f"Closed {self.port}")
     
+    def __enter__(self) -> "UV5RMTransport":
+        if not self.ser or not self.ser.is_open:
+            self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
     def send_raw(self, data: bytes) -> None:
         """
         Send raw bytes to radio.
@@ -247,13 +322,12 @@ class UV5RMTransport:
                 # Step 3: Send mode request
                 self.send_raw(b'\x02')
                 
-                # Step 4: Receive identification (read until 0xDD)
-                response = b""
-                for i in range(12):  # Max 12 bytes for UV-6
-                    byte = self.recv_raw(1)
-                    response += byte
-                    if byte == b'\xDD':
-                        break
+                # Step 4: Receive identification (8 bytes ending in 0xDD, or
+                # 12 bytes on UV-6). Read the common 8 in one call and only
+                # go back for the UV-6 tail.
+                response = self.recv_raw(8)
+                if len(response) == 8 and not response.endswith(b'\xDD'):
+                    response += self.recv_raw(4)
                 
                 # Validate response
                 if len(response) not in [8, 12]:
@@ -285,14 +359,8 @@ class UV5RMTransport:
                 
                 # Normalize 12-byte ident to 8 bytes (for UV-6)
                 if len(response) == 12:
-                    # Filter out 0x01 bytes
-                    ident = b""
-                    for b in response:
-                        if b != 0x01:
-                            ident += bytes([b])
-                    # Take first 8 bytes
-                    if len(ident) > 8:
-                        ident = ident[:8]
+                    # Filter out 0x01 bytes, then take the first 8
+                    ident = response.translate(None, b'\x01')[:8]
                 else:
                     ident = response
                 
@@ -351,12 +419,12 @@ class UV5RMTransport:
                         f"(got {ack.hex()})"
                     )
             
-            # Read response header
-            response_hdr = self.recv_raw(4)
-            if len(response_hdr) != 4:
+            # Read response header and data in a single call
+            response = self.recv_raw(4 + size)
+            if len(response) < 4:
                 raise RadioBlockError(f"Incomplete response header at {addr:04X}")
             
-            cmd, resp_addr, resp_size = struct.unpack(">BHB", response_hdr)
+            cmd, resp_addr, resp_size = struct.unpack_from(">BHB", response)
             
             if cmd != ord('X'):
                 raise RadioBlockError(
@@ -371,8 +439,7 @@ class UV5RMTransport:
                     f"got ({resp_addr:04X}, {resp_size})"
                 )
             
-            # Read data
-            data = self.recv_raw(size)
+            data = response[4:]
             if len(data) != size:
                 raise RadioBlockError(
                     f"Incomplete data at {addr:04X}: "
@@ -421,9 +488,8 @@ class UV5RMTransport:
             
             msg = struct.pack(">BHB", ord('X'), addr, size) + data
             self.send_raw(msg)
-            time.sleep(0.05)
             
-            # Expect ACK
+            # Expect ACK (recv blocks until it arrives or the timeout expires)
             ack = self.recv_raw(1)
             if ack != b'\x06':
                 raise RadioBlockError(
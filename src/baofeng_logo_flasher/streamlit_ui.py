@@ -7,11 +7,14 @@ NOTE: This module requires the optional 'ui' extra to be installed:
     pip install -e ".[ui]"
 """
 
+import json
 import logging
+import os
 import sys
 import tempfile
 import time
 import html
+import io
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -39,6 +42,7 @@ except ImportError as e:
 
 from baofeng_logo_flasher.boot_logo import (
     SERIAL_FLASH_CONFIGS,
+    list_serial_port_info,
     list_serial_ports,
     read_radio_id,
 )
@@ -379,8 +383,6 @@ def _build_model_capability_snapshot(model_name: str) -> dict:
 
 def tab_capabilities():
     """Show capabilities report for radio models."""
-    import json
-
     _render_section_header(
         "Model Capabilities",
         [
@@ -542,34 +544,68 @@ def _process_image_for_radio(
 
 def _image_to_bmp_bytes(img: Image.Image) -> bytes:
     """Convert a PIL image to BMP bytes."""
-    import io
-
     buf = io.BytesIO()
     img.save(buf, format="BMP")
     return buf.getvalue()
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def _convert_upload_to_bmp(
+    image_bytes: bytes,
+    target_size: tuple,
+    bg_color: str = "#000000",
+) -> tuple:
+    """
+    Decode, resize and BMP-encode an uploaded image.
+
+    Streamlit reruns the script on every widget interaction; caching on the
+    upload's content means the image is only converted once per distinct file
+    and target size.
+
+    Returns:
+        (bmp_bytes, input_size, input_format)
+    """
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        input_size, input_format = img.size, img.format
+        processed_img = _process_image_for_radio(img, target_size, bg_color)
+    return _image_to_bmp_bytes(processed_img), input_size, input_format
+
+
 def _last_flash_backup_path(model: str) -> Path:
     """Return path for last flashed logo backup file for a model."""
     safe_model = model.replace(" ", "_").replace("/", "_").lower()
     return Path("backups") / "last_flash" / f"{safe_model}.bmp"
 
 
+def _write_file_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file via a sibling temp file and os.replace.
+
+    Readers (and a crash mid-write) see either the previous file or the new
+    one, never a truncated backup.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as tmp:
+        tmp.write(data)
+    try:
+        os.replace(tmp.name, path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
+
 def _save_last_flash_backup(model: str, bmp_bytes: bytes) -> Path:
     """Persist last successful flashed BMP for user recovery/download."""
     out_path = _last_flash_backup_path(model)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_bytes(bmp_bytes)
-    meta_path = out_path.with_suffix(".json")
-    meta_path.write_text(
-        (
-            "{\n"
-            f'  "model": "{model}",\n'
-            f'  "saved_at": "{datetime.utcnow().isoformat()}Z",\n'
-            f'  "bytes": {len(bmp_bytes)}\n'
-            "}\n"
-        ),
-        encoding="utf-8",
+    _write_file_atomic(out_path, bmp_bytes)
+    meta = {
+        "model": model,
+        "saved_at": f"{datetime.utcnow().isoformat()}Z",
+        "bytes": len(bmp_bytes),
+    }
+    _write_file_atomic(
+        out_path.with_suffix(".json"),
+        (json.dumps(meta, indent=2) + "\n").encode("utf-8"),
     )
     return out_path
 
@@ -587,7 +623,8 @@ def _list_port_metadata() -> dict:
         return {}
 
     info = {}
-    for p in serial.tools.list_ports.comports():
+    # Same snapshot list_serial_ports() took at the start of this rerun.
+    for p in list_serial_port_info():
         info[p.device] = {
             "device": p.device,
             "description": _safe_text(getattr(p, "description", "")),
@@ -981,7 +1018,9 @@ def tab_boot_logo_flasher():
     """Boot logo flashing via serial connection."""
     if "processed_bmp" not in st.session_state:
         st.session_state.processed_bmp = None
-    ports = list_serial_ports()
+    # Rescan once per rerun so hot-plugged adapters show up; helpers later in
+    # the rerun reuse this snapshot.
+    ports = list_serial_ports(refresh=True)
     ports_snapshot = tuple(sorted(ports))
 
     bmp_bytes = st.session_state.processed_bmp
@@ -1094,18 +1133,16 @@ def tab_boot_logo_flasher():
                     st.session_state.processed_bmp = None
                     bmp_bytes = None
                 else:
-                    original_img = Image.open(uploaded_file)
                     expected_size = config["size"]
-                    st.caption(f"Input: {original_img.size[0]}×{original_img.size[1]} ({original_img.format or 'Unknown'})")
 
                     # Fixed conversion path: auto-convert every upload to target BMP size.
-                    processed_img = _process_image_for_radio(
-                        original_img,
-                        expected_size,
+                    bmp_bytes, input_size, input_format = _convert_upload_to_bmp(
+                        uploaded_file.getvalue(),
+                        tuple(expected_size),
                         "#000000",
                     )
-                    st.session_state.processed_bmp = _image_to_bmp_bytes(processed_img)
-                    bmp_bytes = st.session_state.processed_bmp
+                    st.caption(f"Input: {input_size[0]}×{input_size[1]} ({input_format or 'Unknown'})")
+                    st.session_state.processed_bmp = bmp_bytes
                     st.success(f"Converted to {expected_size[0]}×{expected_size[1]} BMP and ready to flash.")
 
                     st.download_button(
@@ -1191,12 +1228,7 @@ def _do_flash(
     debug_bytes: bool = False,
 ):
     """Execute the flash operation using core safety module."""
-    bmp_path = None
     try:
-        with tempfile.NamedTemporaryFile(suffix=".bmp", delete=False) as tmp:
-            tmp.write(bmp_bytes)
-            bmp_path = tmp.name
-
         # Create safety context using core module
         safety_ctx = create_streamlit_safety_context(
             risk_acknowledged=write_confirmed,
@@ -1210,20 +1242,28 @@ def _do_flash(
         status_placeholder = st.empty()
 
         bytes_written = [0]
+        # (last redraw time, last percentage shown); redraws are limited to
+        # ~10/s because each one is a round-trip to the browser.
+        last_redraw = [0.0, -1]
 
         def _progress_cb(written: int, total: int) -> None:
             pct = min(int((written / total) * 100), 100)
             bytes_written[0] = written
-            with progress_placeholder.container():
-                st.progress(pct)
-            with status_placeholder.container():
-                st.text(f"Progress: {written:,} / {total:,} bytes ({pct}%)")
+            now = time.monotonic()
+            if pct == last_redraw[1]:
+                return
+            if written < total and now - last_redraw[0] < 0.1:
+                return
+            last_redraw[0] = now
+            last_redraw[1] = pct
+            progress_placeholder.progress(pct)
+            status_placeholder.text(f"Progress: {written:,} / {total:,} bytes ({pct}%)")
 
         with st.spinner("🔄 Flashing boot logo..." if not simulate else "🧪 Simulating flash..."):
             # Use core module for flash with safety gating
             result = flash_logo_serial(
                 port=port,
-                bmp_path=bmp_path,
+                bmp_path=io.BytesIO(bmp_bytes),
                 config=config,
                 safety_ctx=safety_ctx,
                 progress_cb=_progress_cb if not simulate else None,
@@ -1320,8 +1360,6 @@ def _do_flash(
                 """
             )
     finally:
-        if bmp_path:
-            Path(bmp_path).unlink(missing_ok=True)
         # Resume connection polling after an operation completes.
         st.session_state.connection_freeze_polling = False
         st.session_state.connection_poll_meta["last_probe_ts"] = 0.0
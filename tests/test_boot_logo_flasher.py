@@ -2,13 +2,16 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from PIL import Image
 
+from baofeng_logo_flasher import boot_logo
 from baofeng_logo_flasher.boot_logo import (
     SERIAL_FLASH_CONFIGS,
     BootLogoError,
     flash_logo,
+    list_serial_ports,
     read_radio_id,
 )
 
@@ -77,6 +80,53 @@ class TestFlashSimulation:
             except BootLogoError as exc:
                 assert "only a5" in str(exc).lower() or "unsupported protocol" in str(exc).lower()
 
+    def test_flash_uses_config_baudrate(self):
+        """The config's baud rate (e.g. a --baud override) reaches the uploader."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            image_path = _make_image(Path(tmpdir))
+            cfg = dict(SERIAL_FLASH_CONFIGS["UV-5RM"])
+            cfg["baudrate"] = 57600
+
+            with patch(
+                "baofeng_logo_flasher.protocol.logo_protocol.upload_logo",
+                return_value="ok",
+            ) as upload:
+                flash_logo(port="SIMULATED", bmp_path=image_path, config=cfg)
+
+            assert upload.call_args.kwargs["baudrate"] == 57600
+            assert upload.call_args.kwargs["low_latency"] is True
+
+    def test_flash_passes_low_latency_opt_out(self):
+        """--no-low-latency (config low_latency=False) reaches the uploader."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            image_path = _make_image(Path(tmpdir))
+            cfg = dict(SERIAL_FLASH_CONFIGS["UV-5RM"])
+            cfg["low_latency"] = False
+
+            with patch(
+                "baofeng_logo_flasher.protocol.logo_protocol.upload_logo",
+                return_value="ok",
+            ) as upload:
+                flash_logo(port="SIMULATED", bmp_path=image_path, config=cfg)
+
+            assert upload.call_args.kwargs["low_latency"] is False
+
+
+class TestListSerialPorts:
+    """Test cached serial port enumeration."""
+
+    def test_enumeration_is_cached_until_refresh(self):
+        """Ports are scanned once; refresh=True rescans."""
+        first = [MagicMock(device="/dev/ttyUSB0")]
+        second = first + [MagicMock(device="/dev/ttyUSB1")]
+        with patch("serial.tools.list_ports.comports", side_effect=[first, second]) as comports:
+            assert list_serial_ports(refresh=True) == ["/dev/ttyUSB0"]
+            assert list_serial_ports() == ["/dev/ttyUSB0"]
+            assert list_serial_ports(refresh=True) == ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+
+        assert comports.call_count == 2
+        boot_logo._comports.cache_clear()  # don't leak mocks to later callers
+
 
 class TestReadRadioId:
     """Test protocol constraints for read_radio_id."""
@@ -1,7 +1,13 @@
 import io
+
+import pytest
 from PIL import Image
 
-from baofeng_logo_flasher.bmp_utils import validate_bmp_bytes, convert_image_to_bmp_bytes
+from baofeng_logo_flasher.bmp_utils import (
+    convert_image_to_bmp_bytes,
+    parse_bmp_header,
+    validate_bmp_bytes,
+)
 from baofeng_logo_flasher.boot_logo import BOOT_LOGO_SIZE
 
 
@@ -25,3 +31,16 @@ def test_convert_image_to_bmp_bytes(tmp_path) -> None:
     info = validate_bmp_bytes(data, BOOT_LOGO_SIZE)
     assert info.width == BOOT_LOGO_SIZE[0]
     assert info.height == BOOT_LOGO_SIZE[1]
+
+
+def test_parse_bmp_header_rejects_bad_signature_and_depth() -> None:
+    buffer = io.BytesIO()
+    Image.new("RGB", BOOT_LOGO_SIZE, "red").save(buffer, format="BMP")
+    data = bytearray(buffer.getvalue())
+
+    with pytest.raises(ValueError, match="signature"):
+        parse_bmp_header(b"XX" + bytes(data[2:]))
+
+    data[28] = 8  # bits per pixel
+    with pytest.raises(ValueError, match="24-bit"):
+        parse_bmp_header(bytes(data))
@@ -0,0 +1,220 @@
+"""Tests for CLI command output."""
+
+import gc
+import json
+import logging
+import os
+import subprocess
+import sys
+import warnings
+
+from typer.testing import CliRunner
+
+from baofeng_logo_flasher.cli import app
+
+
+runner = CliRunner()
+
+
+class TestCapabilitiesJson:
+    """Test machine-readable capabilities output."""
+
+    def test_json_output_is_parseable(self):
+        """--json emits a single JSON document with no Rich markup."""
+        result = runner.invoke(app, ["capabilities", "UV-5RM", "--json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["model"] == "UV-5RM"
+        assert "capabilities" in data
+
+    def test_json_output_without_orjson(self, monkeypatch):
+        """The stdlib json fallback produces the same document."""
+        from baofeng_logo_flasher import cli
+
+        fast = runner.invoke(app, ["capabilities", "UV-5RM", "--json"])
+        monkeypatch.setattr(cli, "orjson", None)
+        plain = runner.invoke(app, ["capabilities", "UV-5RM", "--json"])
+
+        assert plain.exit_code == 0
+        assert json.loads(plain.stdout) == json.loads(fast.stdout)
+
+
+class TestImportCost:
+    """Test that the CLI module stays cheap to import."""
+
+    def test_cli_import_skips_serial_protocol(self):
+        """--help and listing commands must not load pyserial/protocol code."""
+        code = (
+            "import sys, baofeng_logo_flasher.cli; "
+            "print(any(m.startswith('baofeng_logo_flasher.protocol') for m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert out.stdout.strip() == "False"
+
+
+class TestLoggingOptions:
+    """Test global logging options."""
+
+    def test_no_rich_installs_plain_handler_on_terminal(self, monkeypatch):
+        """--no-rich skips RichHandler even when stderr is a terminal."""
+        from rich.logging import RichHandler
+
+        from baofeng_logo_flasher import cli
+
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", list(root.handlers))
+        monkeypatch.setattr(root, "level", root.level)
+        monkeypatch.setattr(cli.sys.stderr, "isatty", lambda: True)
+
+        cli._init(verbose=False, no_rich=True)
+        assert root.handlers and not any(isinstance(h, RichHandler) for h in root.handlers)
+
+        cli._init(verbose=False, no_rich=False)
+        assert any(isinstance(h, RichHandler) for h in root.handlers)
+
+    def test_no_rich_is_accepted_before_command(self):
+        """--no-rich is a global option on the app."""
+        result = runner.invoke(app, ["--no-rich", "list-models", "--json"])
+
+        assert result.exit_code == 0
+
+
+class TestModelListingJson:
+    """Test machine-readable model listings."""
+
+    def test_list_models_json(self):
+        """list-models --json lists every model with hex-encoded bytes."""
+        result = runner.invoke(app, ["list-models", "--json"])
+
+        assert result.exit_code == 0
+        models = {m["name"]: m for m in json.loads(result.stdout)["models"]}
+        assert "UV-5RM" in models
+        assert models["UV-5RM"]["handshake_ack"] == "06"
+
+    def test_show_model_config_ignores_case(self):
+        """Model names match case-insensitively and report the canonical name."""
+        result = runner.invoke(app, ["show-model-config", "uv-5rm", "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["model"] == "UV-5RM"
+
+    def test_show_model_config_json_unknown_model(self):
+        """Unknown models report an error document and exit non-zero."""
+        result = runner.invoke(app, ["show-model-config", "NOPE", "--json"])
+
+        assert result.exit_code == 1
+        data = json.loads(result.stdout)
+        assert "UV-5RM" in data["available"]
+
+
+class TestStructuredWarning:
+    """Test rendering of structured warnings."""
+
+    def test_verbose_warning_renders_all_lines_verbatim(self):
+        """Code, detail and remediation are printed without markup parsing."""
+        from baofeng_logo_flasher import cli
+        from baofeng_logo_flasher.core.messages import MessageLevel, WarningCode, WarningItem
+
+        warning = WarningItem(
+            level=MessageLevel.WARN,
+            code=WarningCode.W_MODEL_UNKNOWN,
+            title="Model not recognized",
+            detail="Ident [bold] was not matched",
+            remediation="Pass --model",
+        )
+
+        with cli.console.capture() as capture:
+            cli.print_structured_warning(warning, verbose=True)
+        lines = capture.get().splitlines()
+
+        assert lines[0].endswith("[W_MODEL_UNKNOWN] Model not recognized")
+        assert lines[1].strip() == "Ident [bold] was not matched"
+        assert lines[2].strip() == "→ Pass --model"
+
+
+class TestStatusMessages:
+    """Test the one-line status helpers."""
+
+    def test_error_text_is_not_parsed_as_markup(self):
+        """Brackets in paths or exception text are printed literally."""
+        from baofeng_logo_flasher import cli
+
+        with cli.console.capture() as capture:
+            cli.print_error("Cannot open /tmp/[bold]logo.png")
+
+        assert "/tmp/[bold]logo.png" in capture.get()
+
+
+class TestUploadLogoSerialInput:
+    """Test input-file validation before any port is opened."""
+
+    def test_missing_file_is_rejected(self, tmp_path):
+        """A nonexistent image exits with an error."""
+        result = runner.invoke(
+            app,
+            ["upload-logo-serial", "--port", "/dev/null", "--in", str(tmp_path / "nope.png"), "--dry-run"],
+        )
+
+        assert result.exit_code == 1
+        assert "File not found" in result.stdout
+
+    def test_directory_is_rejected(self, tmp_path):
+        """A directory passes exists() but is not a usable image."""
+        result = runner.invoke(
+            app,
+            ["upload-logo-serial", "--port", "/dev/null", "--in", str(tmp_path), "--dry-run"],
+        )
+
+        assert result.exit_code == 1
+        assert "Not a regular file" in result.stdout
+
+    def test_rejected_arguments_do_not_leak_input_handle(self, tmp_path):
+        """Argument errors exit before the input file is opened."""
+        image = tmp_path / "x.bmp"
+        image.write_bytes(b"BM")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            result = runner.invoke(
+                app,
+                [
+                    "upload-logo-serial", "--port", "/dev/null", "--in", str(image),
+                    "--write-addr-mode", "bogus", "--dry-run",
+                ],
+            )
+            assert result.exit_code == 1
+            del result
+            gc.collect()
+
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+class TestWriteConfirmation:
+    """Test the CLI write-confirmation flow."""
+
+    def test_interactive_confirmation_is_not_asked_twice(self, monkeypatch):
+        """The context confirmed at the prompt passes the core gate silently."""
+        from baofeng_logo_flasher import cli
+        from baofeng_logo_flasher.core.safety import require_write_permission
+
+        answers = iter(["WRITE"])
+        monkeypatch.setattr(cli.sys.stdin, "isatty", lambda: True)
+        monkeypatch.setattr("builtins.input", lambda _prompt: next(answers))
+
+        with cli.console.capture():
+            ctx = cli.confirm_write_with_details(
+                write_flag=True,
+                model="UV-5RM",
+                target_region="logo",
+                bytes_length=16,
+            )
+
+        # A second prompt would exhaust `answers` and raise StopIteration.
+        require_write_permission(ctx, target_region="logo", bytes_length=16)
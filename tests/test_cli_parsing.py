@@ -110,6 +110,26 @@ class TestParseOffset:
         # we would need explicit validation in parse_offset.
 
 
+class TestParseInt:
+    """Test generic integer option parsing."""
+
+    def test_parse_int_decimal_and_hex(self):
+        """Decimal (including leading zeros) and 0x-prefixed hex both parse."""
+        from baofeng_logo_flasher.cli import parse_int
+
+        assert parse_int(None, "size") is None
+        assert parse_int("010", "size") == 10
+        assert parse_int("0x1F", "size") == 31
+        assert parse_int("0X1f", "size") == 31
+
+    def test_parse_int_invalid_raises(self):
+        """Malformed values raise BadParameter naming the option."""
+        from baofeng_logo_flasher.cli import parse_int
+
+        with pytest.raises(typer.BadParameter, match="Invalid size"):
+            parse_int("0b101", "size")
+
+
 class TestParseBitmapFormat:
     """Test bitmap format parsing with aliases."""
 
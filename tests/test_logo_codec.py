@@ -131,5 +131,25 @@ class TestLogoCodec:
         assert mono.mode == '1'
         assert mono.size == (128, 64)
 
+    def test_to_monochrome_without_dither_thresholds(self):
+        """No-dither conversion is a plain threshold, not error diffusion."""
+        dark = Image.new('RGB', (16, 8), (100, 100, 100))
+        light = Image.new('RGB', (16, 8), (160, 160, 160))
+
+        assert LogoCodec.to_monochrome(dark).getextrema() == (0, 0)
+        assert LogoCodec.to_monochrome(light).getextrema() == (255, 255)
+        assert LogoCodec.to_monochrome(dark, dither=True).getextrema() == (0, 255)
+
+    def test_convert_image_accepts_open_image(self, tmp_path):
+        """An already opened image converts the same as its path."""
+        path = tmp_path / "logo.png"
+        Image.new('RGB', (256, 128), (0, 0, 0)).save(path)
+        codec = LogoCodec(BitmapFormat.ROW_MAJOR_MSB)
+
+        with Image.open(path) as img:
+            from_image = codec.convert_image(img, (128, 64))
+
+        assert from_image == codec.convert_image(str(path), (128, 64))
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -1,14 +1,23 @@
 """Tests for A5 logo protocol frame and payload construction."""
 
+import hashlib
+import io
+import json
+
 from PIL import Image
 
 from baofeng_logo_flasher.protocol.logo_protocol import (
     CHUNK_SIZE,
+    CMD_DATA_ACK,
     CONFIG_PAYLOAD,
     SETUP_PAYLOAD,
+    LogoUploader,
+    build_frame,
     build_write_frames,
     chunk_image_data,
     convert_image_to_rgb565,
+    crc16_xmodem,
+    dump_logo_debug_artifacts,
 )
 
 
@@ -45,6 +54,32 @@ def test_build_write_frames_have_expected_len_and_offsets() -> None:
     assert first_frame[5] == 0x00
 
 
+def test_dump_logo_debug_artifacts_streams_frames_and_hash(tmp_path) -> None:
+    """Frame files and the payload stream hash match the joined frame data."""
+    image_data = bytes(range(256)) * 160
+    frames = build_write_frames(image_data)
+    manifest_path = dump_logo_debug_artifacts(image_data, frames, str(tmp_path))
+
+    stream = b"".join(chunk for _, chunk, _ in frames)
+    assert (tmp_path / "write_payload_stream.bin").read_bytes() == stream
+    assert (tmp_path / "write_frames.bin").read_bytes() == b"".join(f for _, _, f in frames)
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert manifest["frame_payload_sha256"] == hashlib.sha256(stream).hexdigest()
+
+
+def test_crc16_xmodem_check_value_and_continuation() -> None:
+    """CRC matches the XMODEM check value and can be computed piecewise."""
+    assert crc16_xmodem(b"123456789") == 0x31C3
+    assert crc16_xmodem(b"56789", crc16_xmodem(b"1234")) == 0x31C3
+
+
+def test_build_frame_crc_covers_header_and_payload() -> None:
+    """Trailing CRC is computed over every frame byte after 0xA5."""
+    frame = build_frame(0x57, 0x0001, b"\x10\x20\x30")
+    crc = crc16_xmodem(frame[1:-2])
+    assert frame[-2:] == bytes([crc >> 8, crc & 0xFF])
+
+
 def test_convert_image_to_rgb565_golden_vector_first_8_bytes(tmp_path) -> None:
     """Golden vector for known 2x2 RGB values (RGB565 little-endian)."""
     img = Image.new("RGB", (2, 2))
@@ -79,3 +114,31 @@ def test_convert_image_to_rgb565_supports_bgr_order(tmp_path) -> None:
 
     # red in BGR565 -> 0x001F -> 1f 00
     assert out == bytes([0x1F, 0x00])
+
+
+def test_convert_image_to_rgb565_accepts_file_object(tmp_path) -> None:
+    """In-memory uploads (e.g. Streamlit) convert without a temp file."""
+    img = Image.new("RGB", (4, 2), color=(12, 200, 90))
+    path = tmp_path / "mem.bmp"
+    img.save(path)
+
+    from_path = convert_image_to_rgb565(str(path), size=(4, 2))
+    from_buffer = convert_image_to_rgb565(io.BytesIO(path.read_bytes()), size=(4, 2))
+
+    assert from_buffer == from_path
+
+
+def test_send_image_data_sends_same_frames_as_build_write_frames() -> None:
+    """Frames sent on the wire match the debug-artifact frame builder."""
+    image_data = bytes(range(256)) * 10 + b"\x01\x02"  # short final chunk
+    uploader = LogoUploader("/dev/null")
+    sent = []
+    uploader._send = sent.append
+    uploader._recv = lambda n: build_frame(CMD_DATA_ACK, 0, b"\x04")[:n]
+    progress = []
+
+    uploader.send_image_data(image_data, lambda d, t: progress.append(d), address_mode="chunk")
+
+    expected = build_write_frames(image_data, address_mode="chunk")
+    assert sent == [frame for _, _, frame in expected]
+    assert progress[-1] == len(image_data)
@@ -0,0 +1,71 @@
+"""Tests for the model registry lookups."""
+
+from baofeng_logo_flasher.models import (
+    Capability,
+    ModelConfig,
+    detect_model,
+    get_capabilities,
+    get_model,
+    invalidate_registry_caches,
+    list_models,
+)
+from baofeng_logo_flasher.models import registry
+
+
+class TestListModels:
+    """Test the cached model name listing."""
+
+    def test_returns_fresh_sorted_list(self):
+        """Callers get their own list, so mutating it is harmless."""
+        names = list_models()
+        names.append("scratch")
+
+        assert list_models() == sorted(registry._MODEL_REGISTRY)
+
+    def test_invalidate_picks_up_late_registration(self):
+        """Models registered after import appear once caches are dropped."""
+        registry._register_model(ModelConfig(name="ZZ-TEST"))
+        try:
+            invalidate_registry_caches()
+            assert "ZZ-TEST" in list_models()
+        finally:
+            del registry._MODEL_REGISTRY["ZZ-TEST"]
+            invalidate_registry_caches()
+
+
+class TestDetectModel:
+    """Test model detection from identification bytes."""
+
+    def test_accepts_bytearray_magic(self):
+        """Magic held in a bytearray still matches (and is cacheable)."""
+        magic = get_model("UV-5RM").magic_bytes
+
+        config = detect_model(magic_used=bytearray(magic))
+        assert config is not None
+        assert config.magic_bytes == magic
+        assert detect_model(magic_used=magic) is config
+
+    def test_no_match_returns_none(self):
+        """Unknown identification yields no model."""
+        assert detect_model(version_bytes=b"\x00" * 8) is None
+
+
+class TestGetCapabilities:
+    """Test capability reports."""
+
+    def test_reports_are_independent(self):
+        """Mutating one report does not leak into the next lookup."""
+        first = get_capabilities("UV-5RM")
+        first.capabilities.clear()
+        first.notes.append("scratch")
+
+        second = get_capabilities("UV-5RM")
+        assert second.capabilities
+        assert "scratch" not in second.notes
+
+    def test_unknown_model_reports_identify_unsupported(self):
+        """Unknown models get a single unsupported IDENTIFY entry."""
+        caps = get_capabilities("NOT-A-RADIO")
+
+        assert [c.capability for c in caps.capabilities] == [Capability.IDENTIFY]
+        assert not caps.capabilities[0].supported
@@ -0,0 +1,53 @@
+"""Tests for core write gating."""
+
+import pytest
+
+from baofeng_logo_flasher.core.safety import (
+    SafetyContext,
+    WriteDenyReason,
+    WritePermissionError,
+    require_write_permission,
+)
+
+
+@pytest.mark.parametrize(
+    "ctx_kwargs, expected",
+    [
+        ({"write_enabled": False}, WriteDenyReason.NEEDS_WRITE_FLAG),
+        ({"model_detected": "unknown"}, WriteDenyReason.UNKNOWN_MODEL),
+        ({"confirmation_token": "nope"}, WriteDenyReason.TOKEN_MISMATCH),
+        ({"interactive": True}, WriteDenyReason.NO_PROMPT_HANDLER),
+        (
+            {"interactive": True, "prompt_confirmation": lambda _: "no"},
+            WriteDenyReason.CONFIRMATION_DECLINED,
+        ),
+        ({}, WriteDenyReason.TOKEN_REQUIRED),
+    ],
+)
+def test_denials_carry_reason_code(ctx_kwargs, expected):
+    """Each gating rule raises with its own WriteDenyReason."""
+    base = {
+        "write_enabled": True,
+        "interactive": False,
+        "model_detected": "UV-5RM",
+        "region_known": True,
+    }
+    ctx = SafetyContext(**{**base, **ctx_kwargs})
+
+    with pytest.raises(WritePermissionError) as excinfo:
+        require_write_permission(ctx, target_region="logo")
+
+    assert excinfo.value.code is expected
+
+
+def test_matching_token_is_permitted():
+    """A correct token passes without prompting."""
+    ctx = SafetyContext(
+        write_enabled=True,
+        confirmation_token="write",
+        interactive=False,
+        model_detected="UV-5RM",
+        region_known=True,
+    )
+
+    require_write_permission(ctx, target_region="logo")
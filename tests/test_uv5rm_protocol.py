@@ -0,0 +1,260 @@
+"""Tests for UV-5RM clone protocol block operations."""
+
+import io
+
+import pytest
+
+from baofeng_logo_flasher.protocol.uv5rm_protocol import UV5RMProtocol
+from baofeng_logo_flasher.protocol.uv5rm_transport import RadioBlockError
+
+
+class FakeTransport:
+    """In-memory stand-in for UV5RMTransport block I/O."""
+
+    def __init__(self, memory: bytes = b"\x00" * 0x2000):
+        self.memory = bytearray(memory)
+        self.reads = []
+        self.writes = []
+
+    def read_block(self, addr: int, size: int, first_block: bool = False) -> bytes:
+        self.reads.append((addr, size, first_block))
+        return bytes(self.memory[addr:addr + size])
+
+    def write_block(self, addr: int, data: bytes) -> None:
+        self.writes.append((addr, bytes(data)))
+        self.memory[addr:addr + len(data)] = data
+
+
+def _pattern(size: int) -> bytes:
+    return bytes(i & 0xFF for i in range(size))
+
+
+class TestReadRange:
+    """Test contiguous range reads."""
+
+    def test_reads_whole_range_in_blocks(self):
+        """Range is split into block-sized requests and reassembled."""
+        transport = FakeTransport(_pattern(0x2000))
+        protocol = UV5RMProtocol(transport)
+
+        data = protocol.read_range(0x0100, 0x0200, 0x40)
+
+        assert data == _pattern(0x2000)[0x0100:0x0200]
+        assert [r[0] for r in transport.reads] == [0x0100, 0x0140, 0x0180, 0x01C0]
+
+    def test_last_block_truncated_to_end(self):
+        """A range that is not block-aligned ends with a short read."""
+        transport = FakeTransport(_pattern(0x2000))
+        protocol = UV5RMProtocol(transport)
+
+        data = protocol.read_range(0x0000, 0x0048, 0x40)
+
+        assert len(data) == 0x48
+        assert transport.reads[-1] == (0x0040, 0x08, False)
+
+    def test_first_block_flag_only_on_first_request(self):
+        """first_block is forwarded for the opening request only."""
+        transport = FakeTransport()
+        protocol = UV5RMProtocol(transport)
+
+        protocol.read_range(0x0000, 0x0080, 0x40, first_block=True)
+
+        assert [r[2] for r in transport.reads] == [True, False]
+
+    def test_block_size_clamped_to_protocol_maximum(self):
+        """Oversized block requests are split at the radio's read limit."""
+        transport = FakeTransport(_pattern(0x2000))
+        protocol = UV5RMProtocol(transport)
+
+        data = protocol.read_range(0x0000, 0x0100, block_size=0x100)
+
+        assert data == _pattern(0x0100)
+        assert {size for _, size, _ in transport.reads} == {UV5RMProtocol.MAX_READ_BLOCK_SIZE}
+
+
+def _clone_image(memory: bytes) -> bytes:
+    """Clone image layout: 8-byte ident followed by memory from 0x0000."""
+    return b"\xAA" + b"\x00" * 6 + b"\xDD" + memory
+
+
+class TestDownloadCloneStreaming:
+    """Test streaming clone download to a writer."""
+
+    @pytest.mark.parametrize("dropped_byte", [False, True])
+    def test_stream_matches_download_clone(self, dropped_byte):
+        """Streamed bytes equal the in-memory image and progress reaches total."""
+        ident = b"\xAA" + b"\x00" * 6 + b"\xDD"
+        protocol = UV5RMProtocol(FakeTransport(_pattern(0x2000)))
+        protocol._radio_ident = ident
+        protocol._has_dropped_byte = dropped_byte
+        progress = []
+
+        out = io.BytesIO()
+        written = protocol.download_clone_to(out, progress_cb=lambda d, t: progress.append((d, t)))
+
+        expected = ident + _pattern(0x2000)[:0x1800] + _pattern(0x2000)[0x1EC0:0x2000]
+        assert out.getvalue() == expected
+        assert written == len(expected)
+        assert progress[-1] == (len(expected), len(expected))
+        assert protocol.download_clone() == expected
+
+
+class TestUploadCloneVerify:
+    """Test inline readback verification during clone upload."""
+
+    def _protocol(self, transport: FakeTransport) -> UV5RMProtocol:
+        protocol = UV5RMProtocol(transport)
+        protocol._radio_ident = b"\xAA" + b"\x00" * 6 + b"\xDD"
+        return protocol
+
+    def test_verify_reads_back_each_written_block(self):
+        """Each write is followed by a readback of the same block."""
+        transport = FakeTransport()
+        protocol = self._protocol(transport)
+
+        protocol.upload_clone(_clone_image(_pattern(0x1800)), verify=True)
+
+        assert len(transport.writes) == 0x1800 // 0x10
+        assert [(a, s) for a, s, _ in transport.reads] == [(a, len(d)) for a, d in transport.writes]
+        assert bytes(transport.memory[:0x1800]) == _pattern(0x1800)
+
+    def test_verify_aborts_on_first_mismatch(self):
+        """A block that reads back differently stops the upload."""
+        transport = FakeTransport()
+        original_write = transport.write_block
+
+        def _flaky_write(addr, data):
+            original_write(addr, b"\xFF" * len(data) if addr == 0x0020 else data)
+
+        transport.write_block = _flaky_write
+        protocol = self._protocol(transport)
+
+        with pytest.raises(RadioBlockError, match="0020"):
+            protocol.upload_clone(_clone_image(_pattern(0x1800)), verify=True)
+
+        assert transport.reads[-1][0] == 0x0020
+
+    def test_verify_block_size_batches_readback(self):
+        """Readback covers several written blocks per request."""
+        transport = FakeTransport()
+        protocol = self._protocol(transport)
+        image = _clone_image(_pattern(0x1800) + _pattern(0x140))
+
+        protocol.upload_clone(image, verify=True, verify_block_size=0x40)
+
+        assert {s for _, s, _ in transport.reads} == {0x40}
+        assert [a for a, _, _ in transport.reads][-1] == 0x1FC0
+        assert len(transport.reads) == (0x1800 + 0x140) // 0x40
+
+    def test_batched_verify_reports_mismatching_block(self):
+        """A mismatch inside a batched span names the bad write block."""
+        transport = FakeTransport()
+        original_write = transport.write_block
+
+        def _flaky_write(addr, data):
+            original_write(addr, b"\xFF" * len(data) if addr == 0x0060 else data)
+
+        transport.write_block = _flaky_write
+        protocol = self._protocol(transport)
+
+        with pytest.raises(RadioBlockError, match="at 0060"):
+            protocol.upload_clone(
+                _clone_image(_pattern(0x1800)), verify=True, verify_block_size=0x40
+            )
+
+        assert transport.reads[-1][:2] == (0x0040, 0x40)
+
+    def test_batched_verify_keeps_small_reads_for_dropped_byte_tail(self):
+        """Dropped-byte radios read the aux tail back per write block."""
+        transport = FakeTransport()
+        protocol = self._protocol(transport)
+        protocol._has_dropped_byte = True
+
+        protocol.upload_clone(
+            _clone_image(_pattern(0x1800) + _pattern(0x140)),
+            verify=True,
+            verify_block_size=0x40,
+        )
+
+        aux_reads = [(a, s) for a, s, _ in transport.reads if a >= 0x1800]
+        assert aux_reads == [(0x1FC0, 0x10), (0x1FD0, 0x10), (0x1FE0, 0x10), (0x1FF0, 0x10)]
+
+
+class TestUploadCloneSkipUnchanged:
+    """Test read-before-write skipping of identical blocks."""
+
+    def test_unchanged_blocks_are_not_rewritten(self):
+        """Only blocks whose radio contents differ are written."""
+        memory = bytearray(_pattern(0x2000))
+        memory[0x0105] ^= 0xFF
+        transport = FakeTransport(bytes(memory))
+        protocol = UV5RMProtocol(transport)
+        protocol._radio_ident = b"\xAA" + b"\x00" * 6 + b"\xDD"
+
+        protocol.upload_clone(_clone_image(_pattern(0x1800)), skip_unchanged=True)
+
+        assert [addr for addr, _ in transport.writes] == [0x0100]
+        assert len(transport.reads) == 0x1800 // 0x10
+        assert bytes(transport.memory[:0x1800]) == _pattern(0x1800)
+
+
+class TestUploadSchedule:
+    """Test the clone upload block schedule."""
+
+    def test_aux_blocks_follow_main_memory_in_image(self):
+        """Aux address 0x1EC0 maps to the image byte right after main memory."""
+        protocol = UV5RMProtocol(FakeTransport())
+
+        schedule = dict(protocol._upload_schedule(8 + 0x1800 + 0x140))
+
+        assert schedule[0x0000] == 8
+        assert schedule[0x17F0] == 8 + 0x17F0
+        assert schedule[0x1EC0] == 8 + 0x1800
+        assert schedule[0x1FF0] == 8 + 0x1800 + 0x130
+
+    def test_dropped_byte_radios_only_get_aux_tail(self):
+        """The dropped-byte workaround restricts aux writes to 0x1FC0+."""
+        protocol = UV5RMProtocol(FakeTransport())
+        protocol._has_dropped_byte = True
+
+        aux = [addr for addr, _ in protocol._upload_schedule(8 + 0x1800 + 0x140) if addr >= 0x1800]
+
+        assert aux == [0x1FC0, 0x1FD0, 0x1FE0, 0x1FF0]
+
+    def test_aux_blocks_beyond_image_are_skipped(self):
+        """An image without aux data schedules main memory only."""
+        protocol = UV5RMProtocol(FakeTransport())
+
+        schedule = protocol._upload_schedule(8 + 0x1800)
+
+        assert len(schedule) == 0x1800 // 0x10
+
+
+class TestVerifyCloneFailFast:
+    """Test early exit from clone verification."""
+
+    def test_fail_fast_stops_at_first_mismatch(self):
+        """No further blocks are read once a mismatch is found."""
+        memory = bytearray(_pattern(0x2000))
+        memory[0x0050] ^= 0xFF
+        transport = FakeTransport(bytes(memory))
+        protocol = UV5RMProtocol(transport)
+
+        result = protocol.verify_clone(_clone_image(_pattern(0x2000)), fail_fast=True)
+
+        assert result["verified"] is False
+        assert [e["address"] for e in result["errors"]] == [0x0040]
+        assert [r[0] for r in transport.reads] == [0x0000, 0x0040]
+
+    def test_default_reports_every_mismatch(self):
+        """Without fail_fast, all mismatching blocks are collected."""
+        memory = bytearray(_pattern(0x2000))
+        memory[0x0050] ^= 0xFF
+        memory[0x0150] ^= 0xFF
+        transport = FakeTransport(bytes(memory))
+        protocol = UV5RMProtocol(transport)
+
+        result = protocol.verify_clone(_clone_image(_pattern(0x2000)), ranges=[(0x0000, 0x0200)])
+
+        assert [e["address"] for e in result["errors"]] == [0x0040, 0x0140]
+        assert result["checked_bytes"] == 0x200
@@ -0,0 +1,165 @@
+"""Tests for the UV-5RM serial transport layer."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from baofeng_logo_flasher.protocol.uv5rm_transport import (
+    RadioBlockError,
+    SERIAL_BUFFER_SIZE,
+    UV5RMTransport,
+    enable_low_latency,
+    enlarge_buffers,
+)
+
+
+def _fake_serial() -> MagicMock:
+    ser = MagicMock()
+    ser.is_open = True
+
+    def _close():
+        ser.is_open = False
+
+    ser.close.side_effect = _close
+    return ser
+
+
+class TestTransportLifecycle:
+    """Test opening and closing the serial port."""
+
+    def test_context_manager_closes_on_error(self):
+        """Port is closed exactly once even when the body raises."""
+        ser = _fake_serial()
+        with patch("serial.Serial", return_value=ser):
+            with pytest.raises(RuntimeError):
+                with UV5RMTransport("/dev/null") as transport:
+                    assert transport.ser is ser
+                    raise RuntimeError("boom")
+
+        ser.close.assert_called_once()
+
+    def test_close_is_idempotent(self):
+        """Repeated close() calls do not touch an already-closed port."""
+        ser = _fake_serial()
+        with patch("serial.Serial", return_value=ser):
+            transport = UV5RMTransport("/dev/null")
+            transport.open()
+            transport.close()
+            transport.close()
+
+        ser.close.assert_called_once()
+        assert transport.ser is None
+
+    def test_close_releases_handle_after_failed_port(self):
+        """close() drops a handle pyserial already reports as closed."""
+        transport = UV5RMTransport("/dev/null")
+        transport.ser = _fake_serial()
+        transport.ser.is_open = False
+        transport.close()
+
+        assert transport.ser is None
+
+
+class TestLowLatency:
+    """Test USB-serial low-latency configuration."""
+
+    def test_open_enables_low_latency(self):
+        """open() requests ASYNC_LOW_LATENCY when the driver supports it."""
+        ser = _fake_serial()
+        with patch("serial.Serial", return_value=ser):
+            UV5RMTransport("/dev/null").open()
+
+        ser.set_low_latency_mode.assert_called_once_with(True)
+
+    def test_open_can_skip_low_latency(self):
+        """low_latency=False leaves the driver's latency setting untouched."""
+        ser = _fake_serial()
+        with patch("serial.Serial", return_value=ser):
+            UV5RMTransport("/dev/null", low_latency=False).open()
+
+        ser.set_low_latency_mode.assert_not_called()
+
+    def test_unsupported_driver_is_not_fatal(self):
+        """A driver that rejects the ioctl leaves the port usable."""
+        ser = _fake_serial()
+        ser.set_low_latency_mode.side_effect = ValueError("ioctl failed")
+
+        assert enable_low_latency(ser) is False
+
+    def test_platform_without_support_is_skipped(self):
+        """Ports without set_low_latency_mode (non-Linux) are left alone."""
+        ser = MagicMock(spec=["port"])
+
+        assert enable_low_latency(ser) is False
+
+
+class TestBufferSize:
+    """Test driver queue sizing."""
+
+    def test_open_enlarges_buffers_when_supported(self):
+        """open() resizes driver queues on backends with set_buffer_size."""
+        ser = _fake_serial()
+        with patch("serial.Serial", return_value=ser):
+            UV5RMTransport("/dev/null").open()
+
+        ser.set_buffer_size.assert_called_once_with(
+            rx_size=SERIAL_BUFFER_SIZE, tx_size=SERIAL_BUFFER_SIZE
+        )
+
+    def test_backend_without_support_is_skipped(self):
+        """POSIX ports have no set_buffer_size and are left alone."""
+        ser = MagicMock(spec=["port"])
+
+        assert enlarge_buffers(ser) is False
+
+
+def _open_transport(ser: MagicMock) -> UV5RMTransport:
+    transport = UV5RMTransport("/dev/null")
+    transport.ser = ser
+    return transport
+
+
+class TestBulkReads:
+    """Test that responses are read in as few serial calls as possible."""
+
+    def test_read_block_reads_header_and_data_at_once(self):
+        """Header and payload come from one read of 4 + size bytes."""
+        ser = _fake_serial()
+        ser.write.side_effect = len
+        payload = bytes(range(0x40))
+        ser.read.side_effect = [b"\x06", b"X\x01\x00\x40" + payload]
+
+        data = _open_transport(ser).read_block(0x0100, 0x40)
+
+        assert data == payload
+        assert [c.args[0] for c in ser.read.call_args_list] == [1, 4 + 0x40]
+
+    def test_read_block_short_data_raises(self):
+        """A truncated response is reported as incomplete data."""
+        ser = _fake_serial()
+        ser.write.side_effect = len
+        ser.read.side_effect = [b"X\x01\x00\x40" + b"\x00" * 10]
+
+        with pytest.raises(RadioBlockError, match="Incomplete data"):
+            _open_transport(ser).read_block(0x0100, 0x40, first_block=True)
+
+    @pytest.mark.parametrize(
+        "ident_reads, expected",
+        [
+            ([b"\xAA\x01\x02\x03\x04\x05\x06\xDD"], b"\xAA\x01\x02\x03\x04\x05\x06\xDD"),
+            (
+                [b"\xAA\x01\x02\x01\x03\x04\x01\x05", b"\x06\x07\x01\xDD"],
+                b"\xAA\x02\x03\x04\x05\x06\x07\xDD",
+            ),
+        ],
+    )
+    def test_handshake_reads_ident_in_bulk(self, ident_reads, expected):
+        """8-byte idents take one read; 12-byte UV-6 idents take two."""
+        ser = _fake_serial()
+        ser.write.side_effect = len
+        ser.read.side_effect = [b"", b"\x06", *ident_reads, b"\x06"]
+
+        with patch("time.sleep"):
+            ident = _open_transport(ser).handshake(b"\x50\xBB\xFF\x20\x12\x07\x25", retry_count=0)
+
+        assert ident == expected